@@ -2,6 +2,7 @@
 JSON cache loader with validation and singleton pattern.
 Supports loading from local file or GCS Fuse mounted path.
 """
+import gzip
 import json
 import logging
 import os
@@ -64,6 +65,7 @@ class CacheLoader:
 
         # Validate cache structure
         self._validate_cache(cache_data)
+        self._load_dependency_sidecar(cache_path, cache_data)
 
         # Initialize engine
         self._engine = LineageGraphEngine()
@@ -85,6 +87,31 @@ class CacheLoader:
         if not cache_data["objects"]:
             raise ValueError("Invalid cache: no objects found")
 
+    def _load_dependency_sidecar(self, cache_path: Path, cache_data: dict) -> None:
+        """Append table-level dependencies kept in a JSON-Lines sidecar next to the cache."""
+        sidecar_name = cache_data["metadata"].get("dependencies_sidecar")
+        if not sidecar_name:
+            return
+
+        sidecar_path = cache_path.parent / sidecar_name
+        if not sidecar_path.exists():
+            logger.warning(f"Dependency sidecar not found: {sidecar_path}")
+            return
+
+        deps = cache_data["dependencies"]
+        if isinstance(deps, list):
+            deps = cache_data["dependencies"] = {"table_level": deps}
+        table_deps = deps.setdefault("table_level", [])
+
+        opener = gzip.open if sidecar_path.suffix == ".gz" else open
+        count = 0
+        with opener(sidecar_path, "rt", encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    table_deps.append(json.loads(line))
+                    count += 1
+        logger.info(f"Loaded {count} dependencies from sidecar {sidecar_path.name}")
+
     def reload(self, cache_path: Optional[Path] = None) -> LineageGraphEngine:
         """Force reload the cache."""
         self._engine = None
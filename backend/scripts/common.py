@@ -0,0 +1,98 @@
+"""
+Helpers shared by the lineage scripts.
+
+JSON is read and written with orjson when it is installed, stdlib json otherwise.
+"""
+import json
+from dataclasses import asdict, is_dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Iterator
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# Below this many views / scripts / SQL files, the extractors parse inline:
+# process pool startup costs more than it saves
+PARALLEL_PARSE_THRESHOLD = 50
+
+
+def json_default(value: Any) -> Any:
+    """Encode values JSON has no type for: ISO-8601 for datetimes, dicts for dataclasses, str otherwise."""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if is_dataclass(value):
+        return asdict(value)
+    return str(value)
+
+
+def loads(data) -> Any:
+    """Parse JSON text (str or bytes)."""
+    if HAS_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(value: Any, pretty: bool = False) -> bytes:
+    """
+    Encode a value as JSON, indented by two spaces with pretty.
+
+    Without orjson this is json.dumps(value, indent=2 if pretty else None).
+    """
+    if HAS_ORJSON:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if pretty else 0)
+        return orjson.dumps(value, option=option, default=json_default)
+    return json.dumps(value, indent=2 if pretty else None, default=json_default).encode("utf-8")
+
+
+def iter_json(value: Any, pretty: bool = True, level: int = 0, stream_levels: int = 3) -> Iterator[str]:
+    """
+    Yield the JSON text of value piece by piece.
+
+    Containers nested less than stream_levels deep are emitted one entry at a time;
+    anything deeper is encoded in one go by dumps. Without orjson, the concatenated
+    output is identical to json.dumps(value, indent=2 if pretty else None).
+    """
+    if level >= stream_levels or not isinstance(value, (dict, list)) or not value:
+        text = dumps(value, pretty).decode("utf-8")
+        yield text.replace("\n", "\n" + "  " * level) if pretty else text
+        return
+
+    is_dict = isinstance(value, dict)
+    inner = "\n" + "  " * (level + 1) if pretty else ""
+    separator = "," + inner if pretty else ", "
+
+    yield "{" if is_dict else "["
+    for i, item in enumerate(value.items() if is_dict else value):
+        yield separator if i else inner
+        if is_dict:
+            key, item = item
+            yield dumps(key).decode("utf-8") + ": "
+        yield from iter_json(item, pretty, level + 1, stream_levels)
+    yield ("\n" + "  " * level if pretty else "") + ("}" if is_dict else "]")
+
+
+def read_json(path) -> dict:
+    """Load a JSON file."""
+    with open(path, "rb") as f:
+        return loads(f.read())
+
+
+def write_json(data: dict, output_path: Path) -> None:
+    """Write data as indented JSON."""
+    with open(output_path, "wb") as f:
+        f.write(dumps(data, pretty=True))
+
+
+def write_json_stream(data: dict, output_path: Path, pretty: bool = True) -> None:
+    """
+    Write data as JSON one entry at a time (see iter_json).
+
+    Only a single object / dependency is ever encoded in memory, rather than the whole cache.
+    """
+    with open(output_path, "w", encoding="utf-8") as f:
+        for chunk in iter_json(data, pretty):
+            f.write(chunk)
@@ -9,46 +9,151 @@ Usage:
     python extract_bq_exasol_bridge.py --project PROJECT --dataset DATASET --table TABLE --output bridge_lineage.json
     python extract_bq_exasol_bridge.py --project PROJECT --dataset DATASET --table TABLE --merge-with lineage_cache.json --output lineage_cache.json
 
+    Output paths ending in .gz or .zst are written compressed; --merge-with inputs
+    are decompressed automatically.
+
+    With --deps-jsonl, table-level dependencies are appended to
+    <output>.dependencies.jsonl.gz (deduplicated via <output>.dependencies.keys)
+    instead of being rewritten into the cache on every merge.
+
 Environment:
     GOOGLE_APPLICATION_CREDENTIALS: Path to service account JSON (or use gcloud auth)
 """
 
 import argparse
+import gzip
+import hashlib
+import io
 import json
 import logging
-from datetime import datetime
+import os
+from datetime import datetime, timezone
 from pathlib import Path
 
 from google.cloud import bigquery
 
+try:
+    import zstandard
+    HAS_ZSTD = True
+except ImportError:
+    HAS_ZSTD = False
+
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
 
+GZIP_MAGIC = b"\x1f\x8b"
+ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+
+
+def _require_zstd():
+    if not HAS_ZSTD:
+        raise RuntimeError("zstandard not installed. Run: pip install zstandard")
+
+
+def open_cache_for_read(path: str):
+    """Open a cache file as text, transparently decompressing gzip/zstd by magic bytes."""
+    with open(path, "rb") as f:
+        magic = f.read(4)
+
+    if magic.startswith(GZIP_MAGIC):
+        return gzip.open(path, "rt", encoding="utf-8")
+    if magic.startswith(ZSTD_MAGIC):
+        _require_zstd()
+        reader = zstandard.ZstdDecompressor().stream_reader(open(path, "rb"))
+        return io.TextIOWrapper(reader, encoding="utf-8")
+    return open(path, encoding="utf-8")
+
+
+def open_cache_for_write(path: str):
+    """Open a cache file as text, compressing when the name ends in .gz or .zst."""
+    if path.endswith(".gz"):
+        return gzip.open(path, "wt", encoding="utf-8")
+    if path.endswith(".zst"):
+        _require_zstd()
+        writer = zstandard.ZstdCompressor().stream_writer(open(path, "wb"))
+        return io.TextIOWrapper(writer, encoding="utf-8")
+    return open(path, "w", encoding="utf-8")
+
+
+def dependency_sidecar_paths(output: str) -> tuple[Path, Path]:
+    """Return the (JSON-Lines, keys) sidecar paths used for table-level dependencies of an output."""
+    output_path = Path(output)
+    stem = output_path.name.removesuffix(".gz").removesuffix(".zst").removesuffix(".json")
+    return (
+        output_path.with_name(f"{stem}.dependencies.jsonl.gz"),
+        output_path.with_name(f"{stem}.dependencies.keys"),
+    )
+
+
+def append_dependencies_sidecar(output: str, deps: list[dict]) -> int:
+    """
+    Append table-level dependencies to the output's JSON-Lines sidecar.
+
+    Only deps whose (source, target) pair is not yet listed in the keys file are
+    written, so the cost is proportional to the new deps rather than the whole
+    dependency history. Returns the number of deps appended.
+    """
+    jsonl_path, keys_path = dependency_sidecar_paths(output)
+
+    existing_keys = set()
+    if keys_path.exists():
+        with open(keys_path, encoding="utf-8") as f:
+            existing_keys = {tuple(line.rstrip("\n").split("\t")) for line in f if line.strip()}
+
+    new_lines = []
+    new_keys = []
+    for dep in deps:
+        source = dep.get("source_id") or dep.get("source_object_id")
+        target = dep.get("target_id") or dep.get("target_object_id")
+        if not source or not target or (source, target) in existing_keys:
+            continue
+        existing_keys.add((source, target))
+        new_lines.append(json.dumps(dep) + "\n")
+        new_keys.append(f"{source}\t{target}\n")
+
+    if new_lines:
+        # Appending to a gzip file adds a new member; readers see one continuous stream
+        with gzip.open(jsonl_path, "at", encoding="utf-8") as f:
+            f.writelines(new_lines)
+        with open(keys_path, "a", encoding="utf-8") as f:
+            f.writelines(new_keys)
+
+    return len(new_lines)
+
+
+SYNC_METADATA_QUERY = """
+SELECT DISTINCT
+    batch_name,
+    task_name,
+    table_type,
+    bq_project_id,
+    bq_dataset_id,
+    bq_table_name,
+    exa_stg_schema_name,
+    exa_stg_table_name,
+    exa_dm_schema_name,
+    exa_dm_table_name,
+    is_snapshot
+FROM `{table_fqn}`
+""".strip()
+
+
 def fetch_sync_metadata(project: str, dataset: str, table: str) -> list[dict]:
     """Fetch sync metadata from BigQuery."""
     client = bigquery.Client(project=project)
 
-    query = f"""
-    SELECT DISTINCT
-        batch_name,
-        task_name,
-        table_type,
-        bq_project_id,
-        bq_dataset_id,
-        bq_table_name,
-        exa_stg_schema_name,
-        exa_stg_table_name,
-        exa_dm_schema_name,
-        exa_dm_table_name,
-        is_snapshot
-    FROM `{project}.{dataset}.{table}`
-    """
+    # Identifiers can't be query parameters, so keep the SQL text byte-identical
+    # between runs (canonical FQN, fixed template) to let BigQuery serve repeats
+    # from its results cache.
+    table_fqn = ".".join(part.strip().strip("`") for part in (project, dataset, table))
+    query = SYNC_METADATA_QUERY.format(table_fqn=table_fqn)
+    job_config = bigquery.QueryJobConfig(use_query_cache=True)
 
-    logger.info(f"Querying {project}.{dataset}.{table}...")
+    logger.info(f"Querying {table_fqn}...")
 
     results = []
-    query_job = client.query(query)
+    query_job = client.query(query, job_config=job_config)
 
     for row in query_job:
         results.append({
@@ -69,7 +174,53 @@ def fetch_sync_metadata(project: str, dataset: str, table: str) -> list[dict]:
     return results
 
 
-def build_lineage_from_sync(sync_records: list[dict], column_mappings: dict = None) -> dict:
+def compute_fingerprint(sync_records: list[dict]) -> str:
+    """
+    Compute an order-independent content hash of the sync metadata.
+
+    Records are serialized with sorted keys and then sorted themselves, since
+    SELECT DISTINCT gives no row-order guarantee between runs.
+    """
+    digest = hashlib.blake2b()
+    for line in sorted(json.dumps(r, sort_keys=True, default=str) for r in sync_records):
+        digest.update(line.encode("utf-8"))
+        digest.update(b"\n")
+    return digest.hexdigest()
+
+
+def _fingerprint_path(output: str) -> Path:
+    return Path(f"{output}.fingerprint")
+
+
+def is_output_current(output: str, fingerprint: str, merge_with: str = None) -> bool:
+    """
+    Check whether a previous run already produced this output from the same sync metadata.
+
+    The sidecar fingerprint is only trusted if neither the output nor the merge
+    base has been rewritten since it was recorded.
+    """
+    fp_path = _fingerprint_path(output)
+    output_path = Path(output)
+    if not fp_path.exists() or not output_path.exists():
+        return False
+    if fp_path.read_text().strip() != fingerprint:
+        return False
+
+    fp_mtime = fp_path.stat().st_mtime
+    if output_path.stat().st_mtime > fp_mtime:
+        return False
+    if merge_with and Path(merge_with).exists() and Path(merge_with).stat().st_mtime > fp_mtime:
+        return False
+    return True
+
+
+def write_fingerprint(output: str, fingerprint: str):
+    """Record the fingerprint next to the output file."""
+    _fingerprint_path(output).write_text(fingerprint + "\n")
+
+
+def build_lineage_from_sync(sync_records: list[dict], column_mappings: dict = None,
+                            extracted_at: str = None) -> dict:
     """
     Build lineage objects and dependencies from sync metadata.
 
@@ -77,7 +228,11 @@ def build_lineage_from_sync(sync_records: list[dict], column_mappings: dict = No
         sync_records: List of sync metadata records
         column_mappings: Optional dict mapping "bq_table" -> {"bq_col": "exasol_col", ...}
                         If not provided, assumes 1:1 column name mapping
+        extracted_at: ISO timestamp of the run (defaults to now, UTC)
     """
+    if extracted_at is None:
+        extracted_at = datetime.now(timezone.utc).isoformat()
+
     objects = {}
     dependencies = []
     column_deps = []
@@ -222,7 +377,7 @@ def build_lineage_from_sync(sync_records: list[dict], column_mappings: dict = No
     return {
         "metadata": {
             "source": "bq_exasol_bridge",
-            "extracted_at": datetime.now().isoformat(),
+            "extracted_at": extracted_at,
             "record_count": len(sync_records),
             "column_dependency_count": len(column_deps),
         },
@@ -234,9 +389,16 @@ def build_lineage_from_sync(sync_records: list[dict], column_mappings: dict = No
     }
 
 
-def merge_into_cache(base_path: str, new_data: dict) -> dict:
-    """Merge bridge data into existing cache."""
-    with open(base_path) as f:
+def merge_into_cache(base_path: str, new_data: dict, deps_sidecar_for: str = None,
+                     merged_at: str = None) -> dict:
+    """
+    Merge bridge data into existing cache.
+
+    If deps_sidecar_for is set (the output path), new table-level dependencies are
+    appended to that output's JSON-Lines sidecar instead of the cache itself.
+    merged_at is the ISO timestamp recorded in the metadata (defaults to now, UTC).
+    """
+    with open_cache_for_read(base_path) as f:
         base = json.load(f)
 
     # Normalize base objects to dict if needed
@@ -248,8 +410,8 @@ def merge_into_cache(base_path: str, new_data: dict) -> dict:
     added_objects = 0
     for obj in new_data["objects"]:
         obj_id = obj.get("id") or obj.get("object_id")
-        if obj_id and obj_id not in base_objects:
-            base_objects[obj_id] = obj
+        # Single hash: setdefault returns our obj only if the id was new
+        if obj_id and base_objects.setdefault(obj_id, obj) is obj:
             added_objects += 1
 
     base["objects"] = base_objects
@@ -285,13 +447,21 @@ def merge_into_cache(base_path: str, new_data: dict) -> dict:
 
     # Add new table-level dependencies
     added_deps = 0
+    sidecar_deps = []
     for dep in new_table_deps:
         source = dep.get("source_id") or dep.get("source_object_id")
         target = dep.get("target_id") or dep.get("target_object_id")
         if source and target and (source, target) not in existing_deps:
-            base_deps_list.append(dep)
             existing_deps.add((source, target))
-            added_deps += 1
+            if deps_sidecar_for:
+                sidecar_deps.append(dep)
+            else:
+                base_deps_list.append(dep)
+                added_deps += 1
+
+    if deps_sidecar_for:
+        added_deps = append_dependencies_sidecar(deps_sidecar_for, sidecar_deps)
+        base["metadata"]["dependencies_sidecar"] = dependency_sidecar_paths(deps_sidecar_for)[0].name
 
     # Build existing column deps set
     existing_column_deps = set()
@@ -325,7 +495,7 @@ def merge_into_cache(base_path: str, new_data: dict) -> dict:
     }
 
     # Update metadata
-    base["metadata"]["bridge_merged_at"] = datetime.now().isoformat()
+    base["metadata"]["bridge_merged_at"] = merged_at or datetime.now(timezone.utc).isoformat()
     base["metadata"]["bridge_stats"] = {
         "objects_added": added_objects,
         "dependencies_added": added_deps,
@@ -337,6 +507,26 @@ def merge_into_cache(base_path: str, new_data: dict) -> dict:
     return base
 
 
+def validate_paths(parser: argparse.ArgumentParser, args: argparse.Namespace):
+    """Check merge/output paths up front so misconfigured runs fail before the BigQuery scan."""
+    if args.merge_with:
+        if not Path(args.merge_with).exists():
+            logger.warning(f"Merge target {args.merge_with} not found, output will contain bridge data only")
+        else:
+            # Cheap header peek: a cache is a JSON object, anything else can't be merged into
+            try:
+                with open_cache_for_read(args.merge_with) as f:
+                    head = f.read(4096).lstrip()
+            except (OSError, UnicodeDecodeError, RuntimeError) as e:
+                parser.error(f"cannot read --merge-with {args.merge_with}: {e}")
+            if not head.startswith("{"):
+                parser.error(f"--merge-with {args.merge_with} is not a JSON cache file")
+
+    output_dir = Path(args.output).resolve().parent
+    if not output_dir.is_dir() or not os.access(output_dir, os.W_OK):
+        parser.error(f"output directory {output_dir} is not writable")
+
+
 def main():
     parser = argparse.ArgumentParser(description="Extract BQ-to-Exasol sync metadata for lineage")
     parser.add_argument("--project", required=True, help="GCP project ID")
@@ -344,6 +534,9 @@ def main():
     parser.add_argument("--table", required=True, help="Sync metadata table name")
     parser.add_argument("--output", default="bridge_lineage.json", help="Output file")
     parser.add_argument("--merge-with", help="Existing cache to merge into")
+    parser.add_argument("--force", action="store_true", help="Rebuild even if sync metadata is unchanged")
+    parser.add_argument("--deps-jsonl", action="store_true",
+                        help="Append table-level dependencies to a <output>.dependencies.jsonl.gz sidecar")
     parser.add_argument("--verbose", "-v", action="store_true", help="Verbose output")
 
     args = parser.parse_args()
@@ -351,6 +544,9 @@ def main():
     if args.verbose:
         logging.getLogger().setLevel(logging.DEBUG)
 
+    validate_paths(parser, args)
+    run_ts = datetime.now(timezone.utc).isoformat()
+
     # Fetch sync metadata from BQ
     sync_records = fetch_sync_metadata(args.project, args.dataset, args.table)
 
@@ -358,20 +554,36 @@ def main():
         logger.warning("No sync records found")
         return
 
+    fingerprint = compute_fingerprint(sync_records)
+    if not args.force and is_output_current(args.output, fingerprint, args.merge_with):
+        logger.info(f"No changes in sync metadata since last run, keeping {args.output}")
+        return
+
     # Build lineage
-    lineage_data = build_lineage_from_sync(sync_records)
+    lineage_data = build_lineage_from_sync(sync_records, extracted_at=run_ts)
+    lineage_data["metadata"]["fingerprint"] = fingerprint
 
     logger.info(f"Built {len(lineage_data['objects'])} objects, {len(lineage_data['dependencies'])} dependencies")
 
     # Merge or save directly
+    deps_sidecar_for = args.output if args.deps_jsonl else None
     if args.merge_with and Path(args.merge_with).exists():
-        result = merge_into_cache(args.merge_with, lineage_data)
+        result = merge_into_cache(args.merge_with, lineage_data, deps_sidecar_for=deps_sidecar_for,
+                                  merged_at=run_ts)
+        result["metadata"]["bridge_fingerprint"] = fingerprint
     else:
         result = lineage_data
+        if deps_sidecar_for:
+            added = append_dependencies_sidecar(deps_sidecar_for, result["dependencies"]["table_level"])
+            result["dependencies"]["table_level"] = []
+            result["metadata"]["dependencies_sidecar"] = dependency_sidecar_paths(deps_sidecar_for)[0].name
+            logger.info(f"Appended {added} dependencies to sidecar")
 
     # Save
-    with open(args.output, "w") as f:
-        json.dump(result, f, indent=2)
+    # Compressed outputs (.gz/.zst) are meant for storage/transfer, so skip the indentation
+    with open_cache_for_write(args.output) as f:
+        json.dump(result, f, indent=None if args.output.endswith((".gz", ".zst")) else 2)
+    write_fingerprint(args.output, fingerprint)
 
     logger.info(f"Saved to {args.output}")
 
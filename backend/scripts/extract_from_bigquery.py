@@ -14,12 +14,19 @@ Requirements:
 """
 
 import argparse
-import json
+import hashlib
+import itertools
 import os
+import sqlite3
 import sys
+import tempfile
+import threading
+from collections.abc import MutableMapping
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional, Set, Any
+from typing import Dict, Iterator, List, Optional, Set, Any
 
 try:
     import yaml
@@ -33,6 +40,8 @@ except ImportError:
     print("google-cloud-bigquery not installed. Run: pip install google-cloud-bigquery")
     sys.exit(1)
 
+from common import PARALLEL_PARSE_THRESHOLD, dumps, loads
+
 # Import AST-based parser (shared with Exasol extractor)
 try:
     from script_parser import SQLParser
@@ -50,10 +59,113 @@ except ImportError:
     print("Warning: column_lineage_parser not found. Column-level lineage will be limited.")
 
 
+_STRIP_BACKTICKS = str.maketrans("", "", "`")
+
+
+@lru_cache(maxsize=None)
+def _get_sql_parser() -> "SQLParser":
+    """SQL parser shared within a process (one per parse worker)."""
+    # Use require_schema=True to filter out unqualified names (functions, variables, keywords)
+    return SQLParser(dialect="bigquery", require_schema=True)
+
+
+def _parse_definition_refs(definition: str) -> List[tuple]:
+    """Parse a definition into picklable (full_id, reference_type) tuples."""
+    return [(ref.full_id(), ref.reference_type) for ref in _get_sql_parser().parse(definition)]
+
+
+def _parse_one(key: bytes, definition: str) -> tuple:
+    """Process pool task: parse one definition, returning (key, refs) or (key, None) on failure."""
+    try:
+        return key, _parse_definition_refs(definition)
+    except Exception:
+        # Left uncached; the main process reparses it and reports the error
+        return key, None
+
+
+class SpilledObjectStore(MutableMapping):
+    """
+    Insertion-ordered object map kept in a temporary SQLite file instead of RAM.
+
+    Used when extraction.spill_to_disk is set, for org-wide extractions whose
+    object map would not fit in memory. Values are stored as JSON, so objects
+    read back are copies: reassign them after modifying.
+    """
+
+    COMMIT_EVERY = 1000
+
+    def __init__(self):
+        self._tmpdir = tempfile.TemporaryDirectory(prefix="bq_objects_")
+        self._conn = sqlite3.connect(
+            os.path.join(self._tmpdir.name, "objects.sqlite"),
+            check_same_thread=False,  # Writers are serialized by the extractor lock
+        )
+        self._conn.execute(
+            "CREATE TABLE objects ("
+            "seq INTEGER PRIMARY KEY AUTOINCREMENT, id TEXT NOT NULL UNIQUE, value BLOB NOT NULL)"
+        )
+        self._pending = 0
+
+    def __getitem__(self, object_id: str) -> dict:
+        row = self._conn.execute("SELECT value FROM objects WHERE id = ?", (object_id,)).fetchone()
+        if row is None:
+            raise KeyError(object_id)
+        return loads(row[0])
+
+    def __setitem__(self, object_id: str, obj: dict) -> None:
+        # Upsert keeps the original position, like reassigning a dict key
+        self._conn.execute(
+            "INSERT INTO objects (id, value) VALUES (?, ?) "
+            "ON CONFLICT(id) DO UPDATE SET value = excluded.value",
+            (object_id, dumps(obj)),
+        )
+        self._pending += 1
+        if self._pending >= self.COMMIT_EVERY:
+            self._conn.commit()
+            self._pending = 0
+
+    def __delitem__(self, object_id: str) -> None:
+        if self._conn.execute("DELETE FROM objects WHERE id = ?", (object_id,)).rowcount == 0:
+            raise KeyError(object_id)
+
+    def __contains__(self, object_id: object) -> bool:
+        return self._conn.execute(
+            "SELECT 1 FROM objects WHERE id = ?", (object_id,)
+        ).fetchone() is not None
+
+    def __iter__(self) -> Iterator[str]:
+        for (object_id,) in self._conn.execute("SELECT id FROM objects ORDER BY seq"):
+            yield object_id
+
+    def __len__(self) -> int:
+        return self._conn.execute("SELECT COUNT(*) FROM objects").fetchone()[0]
+
+    def items(self) -> Iterator[tuple]:
+        """Stream (object_id, object) pairs in insertion order with a single query."""
+        for object_id, value in self._conn.execute("SELECT id, value FROM objects ORDER BY seq"):
+            yield object_id, loads(value)
+
+    def values(self) -> Iterator[dict]:
+        """Stream objects in insertion order with a single query."""
+        for (value,) in self._conn.execute("SELECT value FROM objects ORDER BY seq"):
+            yield loads(value)
+
+    def raw_items(self) -> Iterator[tuple]:
+        """Stream (object_id, JSON bytes) pairs without decoding, for writing the cache."""
+        for object_id, value in self._conn.execute("SELECT id, value FROM objects ORDER BY seq"):
+            yield object_id, bytes(value)
+
+    def close(self) -> None:
+        """Close the database and remove its temporary file."""
+        self._conn.close()
+        self._tmpdir.cleanup()
+
+
 class BigQueryLineageExtractor:
     """
-    Extracts lineage data from BigQuery using INFORMATION_SCHEMA:
-    - INFORMATION_SCHEMA.TABLES
+    Extracts lineage data from BigQuery using INFORMATION_SCHEMA and the API:
+    - tables.list API (base tables)
+    - INFORMATION_SCHEMA.COLUMNS
     - INFORMATION_SCHEMA.VIEWS
     - INFORMATION_SCHEMA.ROUTINES (for UDFs/stored procedures)
 
@@ -62,12 +174,38 @@ class BigQueryLineageExtractor:
 
     def __init__(self, config: dict):
         self.config = config
-        self.client: Optional[bigquery.Client] = None
-        self.objects: Dict[str, dict] = {}
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self.objects: MutableMapping = {}
+        if config.get("extraction", {}).get("spill_to_disk", False):
+            self.objects = SpilledObjectStore()
         self.table_deps: List[dict] = []
         self.column_deps: List[dict] = []
-        self.object_counter = 200000  # Start at 200000 to avoid collision with Exasol IDs
+        # Ids of objects with a definition, maintained at insertion so parse phases skip a full scan
+        self._views_with_def: List[str] = []
+        self._routines_with_def: List[str] = []
+        # (source_id, target_id, dependency_type, reference_type) of every dep in table_deps
+        self._dep_seen: Set[tuple] = set()
+        # One shared "project.dataset" string per dataset instead of one per object
+        self._schema_cache: Dict[tuple, str] = {}
+        self._id_prefix_cache: Dict[tuple, str] = {}
+        # Parsed table references keyed by definition digest, shared by view and routine parsing
+        self._parse_cache: Dict[bytes, list] = {}
+        # Lowercased object id -> id as stored, so uppercased parser refs match mixed-case objects
+        self._objects_lower: Dict[str, str] = {}
+        self._id_counter = itertools.count(200001)  # Start above 200000 to avoid collision with Exasol IDs
         self.projects_extracted: List[str] = []
+        # Run timestamp recorded as extracted_at
+        self._now = datetime.now()
+
+    @property
+    def client(self) -> Optional[bigquery.Client]:
+        """BigQuery client of the current thread (each project worker connects its own)."""
+        return getattr(self._local, "client", None)
+
+    @client.setter
+    def client(self, value: Optional[bigquery.Client]) -> None:
+        self._local.client = value
 
     def connect(self, project_id: Optional[str] = None) -> None:
         """Establish connection to BigQuery for a specific project."""
@@ -97,15 +235,85 @@ class BigQueryLineageExtractor:
             print("Disconnected from BigQuery.")
 
     def _next_id(self) -> int:
-        """Generate next unique object ID."""
-        self.object_counter += 1
-        return self.object_counter
+        """Generate next unique object ID (thread-safe)."""
+        return next(self._id_counter)
 
     def _make_object_id(self, project: str, dataset: str, table: str) -> str:
         """Create a unique object ID with bigquery prefix."""
         # Format: bigquery:project.dataset.table
         return f"bigquery:{project}.{dataset}.{table}"
 
+    def _schema_name(self, project: str, dataset: str) -> str:
+        """Return the interned "project.dataset" schema string."""
+        key = (project, dataset)
+        schema = self._schema_cache.get(key)
+        if schema is None:
+            schema = self._schema_cache.setdefault(key, sys.intern(f"{project}.{dataset}"))
+        return schema
+
+    def _id_prefix(self, project: str, dataset: str) -> str:
+        """Return the cached "bigquery:project.dataset." prefix shared by all object IDs of a dataset."""
+        key = (project, dataset)
+        prefix = self._id_prefix_cache.get(key)
+        if prefix is None:
+            prefix = self._id_prefix_cache.setdefault(key, f"bigquery:{self._schema_name(project, dataset)}.")
+        return prefix
+
+    def _region_view(self, view: str, region: str) -> str:
+        """Region-qualified INFORMATION_SCHEMA view covering the current project's datasets in region."""
+        return f"`{self.client.project}`.`{region}`.INFORMATION_SCHEMA.{view}"
+
+    def _datasets_by_region(self, datasets: List[str]) -> Dict[str, List[str]]:
+        """
+        Group datasets by the region qualifier of their location (e.g. "region-eu").
+
+        A region-scoped INFORMATION_SCHEMA view only sees datasets in that region, so
+        metadata is queried once per distinct location. Datasets whose location can't
+        be read fall back to connection.region.
+        """
+        default_region = self.config.get("connection", {}).get("region", "region-us")
+        client = self.client
+        project = client.project
+
+        def region_of(dataset: str) -> str:
+            try:
+                return f"region-{client.get_dataset(f'{project}.{dataset}').location.lower()}"
+            except Exception as e:
+                print(f"    Warning: Could not get location of {dataset}, assuming {default_region}: {e}")
+                return default_region
+
+        # get_dataset is a free metadata call, but one round-trip per dataset
+        max_threads = max(1, self.config.get("extraction", {}).get("max_threads", 8))
+        by_region: Dict[str, List[str]] = {}
+        with ThreadPoolExecutor(max_workers=min(max_threads, len(datasets))) as executor:
+            for dataset, region in zip(datasets, executor.map(region_of, datasets)):
+                by_region.setdefault(region, []).append(dataset)
+        return by_region
+
+    def _iter_rows(self, query: str, datasets: List[str]):
+        """
+        Run a metadata query with the dataset list bound to @datasets and yield rows
+        page by page, so only one page is held in memory at a time.
+        """
+        extraction = self.config.get("extraction", {})
+        job_config = bigquery.QueryJobConfig(
+            query_parameters=[bigquery.ArrayQueryParameter("datasets", "STRING", datasets)],
+            use_query_cache=True,
+            maximum_bytes_billed=extraction.get("max_bytes_billed"),
+        )
+        page_size = extraction.get("page_size", 10000)
+
+        # query_and_wait (google-cloud-bigquery>=3.14) returns small results from a
+        # single call instead of insert + poll round-trips
+        query_and_wait = getattr(self.client, "query_and_wait", None)
+        if query_and_wait is not None:
+            result = query_and_wait(query, job_config=job_config, page_size=page_size)
+        else:
+            result = self.client.query(query, job_config=job_config).result(page_size=page_size)
+
+        for page in result.pages:
+            yield from page
+
     def _should_include_dataset(self, dataset: str) -> bool:
         """Check if dataset should be included based on config."""
         extraction = self.config.get("extraction", {})
@@ -127,52 +335,15 @@ class BigQueryLineageExtractor:
         if not projects:
             # Fall back to single project from connection config
             projects = [self.config.get("connection", {}).get("project_id")]
+        projects = [p for p in projects if p]
 
-        for project_id in projects:
-            if not project_id:
-                continue
-
-            try:
-                self.connect(project_id)
-                self.projects_extracted.append(project_id)
-
-                # Get datasets for this project
-                project_datasets = extraction_config.get("datasets", {})
-
-                # datasets can be:
-                # 1. A list (applies to all projects): ["dataset1", "dataset2"]
-                # 2. A dict mapping project to datasets: {"project1": ["ds1"], "project2": ["ds2"]}
-                if isinstance(project_datasets, dict):
-                    datasets = project_datasets.get(project_id, [])
-                elif isinstance(project_datasets, list):
-                    datasets = project_datasets
-                else:
-                    datasets = []
-
-                if not datasets:
-                    # Get all datasets in project
-                    datasets = [ds.dataset_id for ds in self.client.list_datasets()]
-                    print(f"Found {len(datasets)} datasets in project {project_id}")
-
-                # Filter datasets
-                datasets = [d for d in datasets if self._should_include_dataset(d)]
-                print(f"Processing {len(datasets)} datasets after filtering")
-
-                # Extract from each dataset
-                for dataset in datasets:
-                    print(f"\nProcessing dataset: {project_id}.{dataset}")
-                    # Extract columns first (shared by tables and views)
-                    columns_map = self._extract_columns(dataset)
-                    self._extract_tables(dataset, columns_map)
-                    self._extract_views(dataset, columns_map)
-
-                    if extraction_config.get("include_routines", True):
-                        self._extract_routines(dataset)
-
-            except Exception as e:
-                print(f"Error processing project {project_id}: {e}")
-            finally:
-                self.disconnect()
+        # Projects are independent and network-bound, so extract them concurrently.
+        # Each worker thread gets its own client (see the client property).
+        max_threads = max(1, extraction_config.get("max_threads", 8))
+        if projects:
+            with ThreadPoolExecutor(max_workers=min(max_threads, len(projects))) as executor:
+                connected = list(executor.map(self._extract_project, projects))
+            self.projects_extracted = [p for p, ok in zip(projects, connected) if ok]
 
         # Parse view and routine definitions for dependencies
         if self.config.get("script_parsing", {}).get("enabled", True) and HAS_AST_PARSER:
@@ -189,8 +360,75 @@ class BigQueryLineageExtractor:
 
         return self._build_cache()
 
-    def _extract_columns(self, dataset: str) -> Dict[str, List[dict]]:
-        """Extract columns for all tables/views in a dataset."""
+    def _extract_project(self, project_id: str) -> bool:
+        """Extract all objects of one project. Returns whether the project could be connected."""
+        extraction_config = self.config.get("extraction", {})
+        connected = False
+
+        try:
+            self.connect(project_id)
+            connected = True
+
+            # Get datasets for this project
+            project_datasets = extraction_config.get("datasets", {})
+
+            # datasets can be:
+            # 1. A list (applies to all projects): ["dataset1", "dataset2"]
+            # 2. A dict mapping project to datasets: {"project1": ["ds1"], "project2": ["ds2"]}
+            if isinstance(project_datasets, dict):
+                datasets = project_datasets.get(project_id, [])
+            elif isinstance(project_datasets, list):
+                datasets = project_datasets
+            else:
+                datasets = []
+
+            if not datasets:
+                # Get all datasets in project
+                datasets = [ds.dataset_id for ds in self.client.list_datasets()]
+                print(f"Found {len(datasets)} datasets in project {project_id}")
+
+            # Filter datasets
+            datasets = [d for d in datasets if self._should_include_dataset(d)]
+            print(f"Processing {len(datasets)} datasets in {project_id} after filtering")
+
+            if not datasets:
+                return connected
+
+            # One region-scoped query per metadata view and dataset location covers every dataset
+            print(f"\nProcessing datasets in {project_id}: {', '.join(datasets)}")
+            by_region = self._datasets_by_region(datasets)
+            # Extract columns first (shared by tables and views)
+            columns_map: Dict[str, List[dict]] = {}
+            for region, region_datasets in by_region.items():
+                columns_map.update(self._extract_columns(region, region_datasets))
+            self._extract_tables(datasets, columns_map)
+            for region, region_datasets in by_region.items():
+                self._extract_views(region, region_datasets, columns_map)
+
+                if extraction_config.get("include_routines", True):
+                    self._extract_routines(region, region_datasets)
+
+        except Exception as e:
+            print(f"Error processing project {project_id}: {e}")
+        finally:
+            self.disconnect()
+
+        return connected
+
+    def _add_objects(self, objects: Dict[str, dict], definition_index: Optional[List[str]] = None) -> None:
+        """
+        Merge objects collected by an extraction worker into the shared map.
+
+        Ids of objects carrying a definition are also appended to definition_index.
+        """
+        with self._lock:
+            self.objects.update(objects)
+            self._objects_lower.update((oid.lower(), oid) for oid in objects)
+            if definition_index is not None:
+                definition_index.extend(oid for oid, obj in objects.items() if obj.get("definition"))
+
+    def _extract_columns(self, region: str, datasets: List[str]) -> Dict[str, List[dict]]:
+        """Extract columns for all tables/views in the given datasets (all located in region)."""
         columns_map: Dict[str, List[dict]] = {}
 
         extraction_config = self.config.get("extraction", {})
@@ -207,17 +445,16 @@ class BigQueryLineageExtractor:
             is_nullable,
             data_type,
             column_default
-        FROM `{self.client.project}.{dataset}.INFORMATION_SCHEMA.COLUMNS`
-        ORDER BY table_name, ordinal_position
+        FROM {self._region_view("COLUMNS", region)}
+        WHERE table_schema IN UNNEST(@datasets)
+        ORDER BY table_schema, table_name, ordinal_position
         """
 
         try:
-            result = self.client.query(query).result()
+            result = self._iter_rows(query, datasets)
 
             for row in result:
-                object_id = self._make_object_id(
-                    row.project_id, row.dataset_id, row.table_name
-                )
+                object_id = self._id_prefix(row.project_id, row.dataset_id) + row.table_name
 
                 if object_id not in columns_map:
                     columns_map[object_id] = []
@@ -228,7 +465,6 @@ class BigQueryLineageExtractor:
                     "ordinal_position": row.ordinal_position,
                     "is_nullable": row.is_nullable == "YES",
                     "is_primary_key": False,
-                    "description": None,
                 })
 
         except Exception as e:
@@ -236,52 +472,53 @@ class BigQueryLineageExtractor:
 
         return columns_map
 
-    def _extract_tables(self, dataset: str, columns_map: Dict[str, List[dict]]) -> None:
-        """Extract table objects from a dataset."""
-        print(f"  Extracting tables from {dataset}...")
-
-        query = f"""
-        SELECT
-            table_catalog as project_id,
-            table_schema as dataset_id,
-            table_name,
-            table_type,
-            creation_time
-        FROM `{self.client.project}.{dataset}.INFORMATION_SCHEMA.TABLES`
-        WHERE table_type = 'BASE TABLE'
+    def _extract_tables(self, datasets: List[str], columns_map: Dict[str, List[dict]]) -> None:
         """
+        Extract table objects from the given datasets.
 
-        try:
-            result = self.client.query(query).result()
-            count = 0
-
-            for row in result:
-                object_id = self._make_object_id(
-                    row.project_id, row.dataset_id, row.table_name
-                )
+        Uses the tables.list API rather than INFORMATION_SCHEMA.TABLES: the listing
+        is free and carries everything needed here, whereas a query job is billed.
+        """
+        print(f"  Extracting tables from {len(datasets)} datasets (tables.list API, no query job)...")
+        count = 0
+        objects: Dict[str, dict] = {}
+
+        project = self.client.project
+        for dataset in datasets:
+            # Every table listed below shares the dataset's schema and id prefix
+            schema = self._schema_name(project, dataset)
+            prefix = self._id_prefix(project, dataset)
+            try:
+                for tbl in self.client.list_tables(f"{project}.{dataset}", page_size=1000):
+                    if tbl.table_type != "TABLE":
+                        continue
+
+                    object_id = prefix + tbl.table_id
+
+                    obj = objects[object_id] = {
+                        "id": object_id,
+                        "schema": schema,
+                        "name": tbl.table_id,
+                        "type": "BIGQUERY_TABLE",
+                        "platform": "bigquery",
+                        "owner": "UNKNOWN",
+                        "object_id": self._next_id(),
+                        "created_at": tbl.created,
+                    }
+                    if object_id in columns_map:
+                        obj["columns"] = columns_map[object_id]
+                    count += 1
 
-                self.objects[object_id] = {
-                    "id": object_id,
-                    "schema": f"{row.project_id}.{row.dataset_id}",
-                    "name": row.table_name,
-                    "type": "BIGQUERY_TABLE",
-                    "platform": "bigquery",
-                    "owner": "UNKNOWN",
-                    "object_id": self._next_id(),
-                    "created_at": row.creation_time.isoformat() if row.creation_time else None,
-                    "description": None,
-                    "columns": columns_map.get(object_id, []),
-                }
-                count += 1
+            except Exception as e:
+                print(f"    Error extracting tables from {dataset}: {e}")
 
-            print(f"    Found {count} tables")
+        self._add_objects(objects)
+        print(f"    Found {count} tables")
 
-        except Exception as e:
-            print(f"    Error extracting tables: {e}")
-
-    def _extract_views(self, dataset: str, columns_map: Dict[str, List[dict]]) -> None:
-        """Extract view objects with definitions."""
-        print(f"  Extracting views from {dataset}...")
+    def _extract_views(self, region: str, datasets: List[str], columns_map: Dict[str, List[dict]]) -> None:
+        """Extract view objects with definitions from the given datasets (all located in region)."""
+        print(f"  Extracting views from {len(datasets)} datasets in {region}...")
+        objects: Dict[str, dict] = {}
 
         query = f"""
         SELECT
@@ -289,31 +526,29 @@ class BigQueryLineageExtractor:
             table_schema as dataset_id,
             table_name,
             view_definition
-        FROM `{self.client.project}.{dataset}.INFORMATION_SCHEMA.VIEWS`
+        FROM {self._region_view("VIEWS", region)}
+        WHERE table_schema IN UNNEST(@datasets)
         """
 
         try:
-            result = self.client.query(query).result()
+            result = self._iter_rows(query, datasets)
             count = 0
 
             for row in result:
-                object_id = self._make_object_id(
-                    row.project_id, row.dataset_id, row.table_name
-                )
+                object_id = self._id_prefix(row.project_id, row.dataset_id) + row.table_name
 
-                self.objects[object_id] = {
+                obj = objects[object_id] = {
                     "id": object_id,
-                    "schema": f"{row.project_id}.{row.dataset_id}",
+                    "schema": self._schema_name(row.project_id, row.dataset_id),
                     "name": row.table_name,
                     "type": "BIGQUERY_VIEW",
                     "platform": "bigquery",
                     "owner": "UNKNOWN",
                     "object_id": self._next_id(),
-                    "created_at": None,
-                    "description": None,
                     "definition": row.view_definition,
-                    "columns": columns_map.get(object_id, []),
                 }
+                if object_id in columns_map:
+                    obj["columns"] = columns_map[object_id]
                 count += 1
 
             print(f"    Found {count} views")
@@ -321,9 +556,12 @@ class BigQueryLineageExtractor:
         except Exception as e:
             print(f"    Error extracting views: {e}")
 
-    def _extract_routines(self, dataset: str) -> None:
-        """Extract UDFs and stored procedures."""
-        print(f"  Extracting routines from {dataset}...")
+        self._add_objects(objects, self._views_with_def)
+
+    def _extract_routines(self, region: str, datasets: List[str]) -> None:
+        """Extract UDFs and stored procedures from the given datasets (all located in region)."""
+        print(f"  Extracting routines from {len(datasets)} datasets in {region}...")
+        objects: Dict[str, dict] = {}
 
         query = f"""
         SELECT
@@ -334,31 +572,29 @@ class BigQueryLineageExtractor:
             routine_definition,
             created,
             last_altered
-        FROM `{self.client.project}.{dataset}.INFORMATION_SCHEMA.ROUTINES`
+        FROM {self._region_view("ROUTINES", region)}
+        WHERE routine_schema IN UNNEST(@datasets)
         """
 
         try:
-            result = self.client.query(query).result()
+            result = self._iter_rows(query, datasets)
             count = 0
 
             for row in result:
-                object_id = self._make_object_id(
-                    row.project_id, row.dataset_id, row.routine_name
-                )
+                object_id = self._id_prefix(row.project_id, row.dataset_id) + row.routine_name
 
                 # Map routine type
                 obj_type = "BIGQUERY_UDF" if row.routine_type == "FUNCTION" else "BIGQUERY_PROCEDURE"
 
-                self.objects[object_id] = {
+                objects[object_id] = {
                     "id": object_id,
-                    "schema": f"{row.project_id}.{row.dataset_id}",
+                    "schema": self._schema_name(row.project_id, row.dataset_id),
                     "name": row.routine_name,
                     "type": obj_type,
                     "platform": "bigquery",
                     "owner": "UNKNOWN",
                     "object_id": self._next_id(),
-                    "created_at": row.created.isoformat() if row.created else None,
-                    "description": None,
+                    "created_at": row.created,
                     "definition": row.routine_definition,
                 }
                 count += 1
@@ -368,15 +604,16 @@ class BigQueryLineageExtractor:
         except Exception as e:
             print(f"    Error extracting routines: {e}")
 
+        self._add_objects(objects, self._routines_with_def)
+
     def _parse_view_definitions(self) -> None:
         """Parse view definitions to extract table dependencies."""
         print("\nParsing view definitions for dependencies...")
 
-        # Use require_schema=True to filter out unqualified names (functions, variables, keywords)
-        sql_parser = SQLParser(dialect="bigquery", require_schema=True)
         deps_found = 0
 
-        views = [obj for obj in self.objects.values() if obj.get("definition")]
+        views = [self.objects[vid] for vid in self._views_with_def]
+        self._prime_parse_cache(views)
 
         for view in views:
             definition = view.get("definition", "")
@@ -384,91 +621,144 @@ class BigQueryLineageExtractor:
                 continue
 
             try:
-                refs = sql_parser.parse(definition)
-
-                for ref in refs:
-                    # ref is a TableReference object with .full_id() and .reference_type
-                    ref_table = ref.full_id().upper()
+                refs = self._parse_definition(definition)
+                context_project, context_dataset = self._reference_context(view)
 
+                for ref_table, ref_type in refs:
                     # Handle different reference formats
                     # Could be: table, dataset.table, project.dataset.table
-                    source_id = self._resolve_table_reference(ref_table, view)
+                    source_id = self._canonical_id(
+                        self._resolve_table_reference(ref_table, context_project, context_dataset)
+                    )
 
                     if source_id and source_id in self.objects:
-                        self.table_deps.append({
-                            "source_id": source_id,
-                            "target_id": view["id"],
-                            "dependency_type": "USES",
-                            "reference_type": ref.reference_type,
-                        })
-                        deps_found += 1
+                        if self._add_dependency(source_id, view["id"], "USES", ref_type):
+                            deps_found += 1
                     elif source_id:
                         # Create placeholder for external table reference
                         self._create_external_reference(source_id, ref_table)
-                        self.table_deps.append({
-                            "source_id": source_id,
-                            "target_id": view["id"],
-                            "dependency_type": "USES",
-                            "reference_type": ref.reference_type,
-                        })
-                        deps_found += 1
+                        if self._add_dependency(source_id, view["id"], "USES", ref_type):
+                            deps_found += 1
 
             except Exception as e:
                 print(f"  Warning: Failed to parse view {view['name']}: {e}")
 
         print(f"  Found {deps_found} dependencies from view definitions")
 
-    def _resolve_table_reference(self, ref: str, context_obj: dict) -> Optional[str]:
-        """Resolve a table reference to a full object ID."""
-        parts = ref.replace("`", "").split(".")
+    def _add_dependency(self, source_id: str, target_id: str, dependency_type: str, reference_type: str) -> bool:
+        """Append a table-level dependency unless an identical one exists. Returns whether it was added."""
+        key = (source_id, target_id, dependency_type, reference_type)
+        if key in self._dep_seen:
+            return False
+        self._dep_seen.add(key)
+        self.table_deps.append({
+            "source_id": source_id,
+            "target_id": target_id,
+            "dependency_type": dependency_type,
+            "reference_type": reference_type,
+        })
+        return True
+
+    @staticmethod
+    def _definition_key(definition: str) -> bytes:
+        return hashlib.blake2b(definition.encode("utf-8"), digest_size=16).digest()
+
+    def _parse_definition(self, definition: str) -> List[tuple]:
+        """Return (full_id, reference_type) refs of a definition, reusing results for identical SQL."""
+        key = self._definition_key(definition)
+        refs = self._parse_cache.get(key)
+        if refs is None:
+            refs = self._parse_cache[key] = _parse_definition_refs(definition)
+        return refs
 
-        # Extract project and dataset from context
+    def _prime_parse_cache(self, objects: List[dict]) -> None:
+        """
+        Parse not-yet-seen definitions across CPU cores and store them in the parse cache.
+
+        Parsing is CPU-bound and every definition is independent, so large batches are
+        fanned out to a process pool; small batches are left to _parse_definition.
+        """
+        pending: Dict[bytes, str] = {}
+        for obj in objects:
+            definition = obj.get("definition")
+            if definition:
+                key = self._definition_key(definition)
+                if key not in self._parse_cache:
+                    pending[key] = definition
+
+        max_workers = self.config.get("script_parsing", {}).get("max_workers")
+        if len(pending) < PARALLEL_PARSE_THRESHOLD or max_workers == 1:
+            return
+
+        print(f"  Parsing {len(pending)} distinct definitions in parallel...")
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            for key, refs in executor.map(_parse_one, pending.keys(), pending.values(), chunksize=16):
+                if refs is not None:
+                    self._parse_cache[key] = refs
+
+    @staticmethod
+    def _reference_context(context_obj: dict) -> tuple:
+        """Return the (project, dataset) used to qualify partial references inside an object."""
         schema_parts = context_obj["schema"].split(".")
-        context_project = schema_parts[0] if len(schema_parts) > 0 else self.client.project
+        context_project = schema_parts[0]
         context_dataset = schema_parts[1] if len(schema_parts) > 1 else None
+        return context_project, context_dataset
+
+    @staticmethod
+    def _resolve_table_reference(ref: str, context_project: str, context_dataset: Optional[str]) -> Optional[str]:
+        """Resolve a table reference to a full object ID."""
+        parts = ref.translate(_STRIP_BACKTICKS).split(".")
+        n = len(parts)
 
-        if len(parts) == 3:
+        if n == 3:
             # project.dataset.table
             return f"bigquery:{parts[0]}.{parts[1]}.{parts[2]}"
-        elif len(parts) == 2:
+        elif n == 2:
             # dataset.table - use context project
             return f"bigquery:{context_project}.{parts[0]}.{parts[1]}"
-        elif len(parts) == 1 and context_dataset:
+        elif n == 1 and context_dataset:
             # Just table name - use context project and dataset
             return f"bigquery:{context_project}.{context_dataset}.{parts[0]}"
 
         return None
 
+    def _canonical_id(self, object_id: Optional[str]) -> Optional[str]:
+        """Return the stored id matching object_id case-insensitively, or object_id itself if none does."""
+        if object_id is None:
+            return None
+        return self._objects_lower.get(object_id.lower(), object_id)
+
     def _create_external_reference(self, object_id: str, name: str) -> None:
-        """Create a placeholder object for external references."""
-        if object_id not in self.objects:
-            parts = object_id.replace("bigquery:", "").split(".")
-            schema = ".".join(parts[:-1]) if len(parts) > 1 else "EXTERNAL"
-            table_name = parts[-1] if parts else name
-
-            self.objects[object_id] = {
-                "id": object_id,
-                "schema": schema,
-                "name": table_name,
-                "type": "BIGQUERY_TABLE",  # Assume table
-                "platform": "bigquery",
-                "owner": "EXTERNAL",
-                "object_id": self._next_id(),
-                "created_at": None,
-                "description": "External reference (not in extracted datasets)",
-                "columns": [],
-            }
+        """
+        Create a placeholder object for external references.
+
+        Callers check that object_id is not in self.objects yet, so the common
+        already-known case costs no call.
+        """
+        parts = object_id.replace("bigquery:", "").split(".")
+        schema = ".".join(parts[:-1]) if len(parts) > 1 else "EXTERNAL"
+        table_name = parts[-1] if parts else name
+
+        self.objects[object_id] = {
+            "id": object_id,
+            "schema": schema,
+            "name": table_name,
+            "type": "BIGQUERY_TABLE",  # Assume table
+            "platform": "bigquery",
+            "owner": "EXTERNAL",
+            "object_id": self._next_id(),
+            "description": "External reference (not in extracted datasets)",
+        }
+        self._objects_lower[object_id.lower()] = object_id
 
     def _parse_routine_definitions(self) -> None:
         """Parse stored procedure and UDF definitions to extract table dependencies."""
         print("\nParsing routine definitions for dependencies...")
 
-        # Use require_schema=True to filter out unqualified names (functions, variables, keywords)
-        sql_parser = SQLParser(dialect="bigquery", require_schema=True)
         deps_found = 0
 
-        routines = [obj for obj in self.objects.values()
-                    if obj.get("type") in ("BIGQUERY_UDF", "BIGQUERY_PROCEDURE") and obj.get("definition")]
+        routines = [self.objects[rid] for rid in self._routines_with_def]
+        self._prime_parse_cache(routines)
 
         for routine in routines:
             definition = routine.get("definition", "")
@@ -476,16 +766,15 @@ class BigQueryLineageExtractor:
                 continue
 
             try:
-                refs = sql_parser.parse(definition)
+                refs = self._parse_definition(definition)
+                context_project, context_dataset = self._reference_context(routine)
 
-                for ref in refs:
-                    # ref is a TableReference object with .full_id() and .reference_type
-                    ref_table = ref.full_id().upper()
-                    source_id = self._resolve_table_reference(ref_table, routine)
+                for ref_table, ref_type in refs:
+                    source_id = self._canonical_id(
+                        self._resolve_table_reference(ref_table, context_project, context_dataset)
+                    )
 
                     if source_id:
-                        ref_type = ref.reference_type
-
                         # Determine dependency type based on reference
                         if ref_type in ("DDL", "INSERT", "UPDATE", "DELETE", "MERGE"):
                             dep_type = "WRITES"
@@ -495,25 +784,16 @@ class BigQueryLineageExtractor:
                         # For writes, routine is source, table is target
                         # For reads, table is source, routine is target
                         if dep_type == "WRITES":
-                            self.table_deps.append({
-                                "source_id": routine["id"],
-                                "target_id": source_id,
-                                "dependency_type": dep_type,
-                                "reference_type": ref_type,
-                            })
+                            added = self._add_dependency(routine["id"], source_id, dep_type, ref_type)
                         else:
-                            self.table_deps.append({
-                                "source_id": source_id,
-                                "target_id": routine["id"],
-                                "dependency_type": "USES",
-                                "reference_type": ref_type,
-                            })
+                            added = self._add_dependency(source_id, routine["id"], "USES", ref_type)
 
                         # Create external reference if needed
                         if source_id not in self.objects:
                             self._create_external_reference(source_id, ref_table)
 
-                        deps_found += 1
+                        if added:
+                            deps_found += 1
 
             except Exception as e:
                 print(f"  Warning: Failed to parse routine {routine['name']}: {e}")
@@ -585,7 +865,6 @@ class BigQueryLineageExtractor:
                     "platform": "composer",
                     "owner": "AIRFLOW",
                     "object_id": self._next_id(),
-                    "created_at": None,
                     "description": row.description,
                     "schedule": row.schedule_interval,
                 }
@@ -593,34 +872,22 @@ class BigQueryLineageExtractor:
                 # Parse source tables (DAG reads from these)
                 source_tables = row.source_tables or []
                 if isinstance(source_tables, str):
-                    import json as json_lib
-                    source_tables = json_lib.loads(source_tables)
+                    source_tables = loads(source_tables)
 
                 for source in source_tables:
                     source_id = f"bigquery:{source}" if not source.startswith("bigquery:") else source
-                    self.table_deps.append({
-                        "source_id": source_id,
-                        "target_id": dag_id,
-                        "dependency_type": "READS",
-                        "reference_type": "DAG_INPUT",
-                    })
+                    self._add_dependency(source_id, dag_id, "READS", "DAG_INPUT")
                     if source_id not in self.objects:
                         self._create_external_reference(source_id, source)
 
                 # Parse target tables (DAG writes to these)
                 target_tables = row.target_tables or []
                 if isinstance(target_tables, str):
-                    import json as json_lib
-                    target_tables = json_lib.loads(target_tables)
+                    target_tables = loads(target_tables)
 
                 for target in target_tables:
                     target_id = f"bigquery:{target}" if not target.startswith("bigquery:") else target
-                    self.table_deps.append({
-                        "source_id": dag_id,
-                        "target_id": target_id,
-                        "dependency_type": "WRITES",
-                        "reference_type": "DAG_OUTPUT",
-                    })
+                    self._add_dependency(dag_id, target_id, "WRITES", "DAG_OUTPUT")
                     if target_id not in self.objects:
                         self._create_external_reference(target_id, target)
 
@@ -712,12 +979,19 @@ class BigQueryLineageExtractor:
         return SchemaContext(object_columns=object_columns)
 
     def _build_cache(self) -> dict:
-        """Build the final cache structure."""
+        """
+        Build the final cache structure.
+
+        Optional object fields (description, created_at, columns) are omitted rather
+        than written as null/empty; consumers treat missing keys as unset.
+        created_at holds the datetime returned by BigQuery and is only formatted
+        (ISO-8601) when the cache is written.
+        """
         return {
             "metadata": {
                 "source": "bigquery",
                 "projects": self.projects_extracted,
-                "extracted_at": datetime.now().isoformat(),
+                "extracted_at": self._now.isoformat(),
                 "extractor_version": "1.0.0",
                 "object_count": len(self.objects),
                 "dependency_count": len(self.table_deps),
@@ -741,7 +1015,7 @@ def merge_caches(exasol_cache: dict, bigquery_cache: dict) -> dict:
         "metadata": {
             "source": "multi-platform",
             "platforms": ["exasol", "bigquery"],
-            "extracted_at": datetime.now().isoformat(),
+            "extracted_at": bigquery_cache["metadata"].get("extracted_at") or datetime.now().isoformat(),
             "extractor_version": "1.0.0",
             "object_count": 0,
             "dependency_count": 0,
@@ -753,13 +1027,17 @@ def merge_caches(exasol_cache: dict, bigquery_cache: dict) -> dict:
         },
     }
 
-    # Add Exasol objects (prefix with exasol: if not already)
+    # Add Exasol objects (prefix with exasol: if not already).
+    # Objects that already carry the prefixed id and platform are reused as is.
     for obj_id, obj in exasol_cache.get("objects", {}).items():
-        new_id = obj_id if obj_id.startswith("exasol:") else f"exasol:{obj_id}"
-        obj_copy = obj.copy()
-        obj_copy["id"] = new_id
-        obj_copy["platform"] = "exasol"
-        merged["objects"][new_id] = obj_copy
+        if obj_id.startswith("exasol:"):
+            new_id = obj_id
+            if obj.get("id") == new_id and obj.get("platform") == "exasol":
+                merged["objects"][new_id] = obj
+                continue
+        else:
+            new_id = f"exasol:{obj_id}"
+        merged["objects"][new_id] = {**obj, "id": new_id, "platform": "exasol"}
 
     # Add BigQuery objects
     for obj_id, obj in bigquery_cache.get("objects", {}).items():
@@ -767,12 +1045,15 @@ def merge_caches(exasol_cache: dict, bigquery_cache: dict) -> dict:
 
     # Merge dependencies (update IDs for Exasol)
     for dep in exasol_cache.get("dependencies", {}).get("table_level", []):
-        dep_copy = dep.copy()
-        if not dep_copy["source_id"].startswith("exasol:"):
-            dep_copy["source_id"] = f"exasol:{dep_copy['source_id']}"
-        if not dep_copy["target_id"].startswith("exasol:"):
-            dep_copy["target_id"] = f"exasol:{dep_copy['target_id']}"
-        merged["dependencies"]["table_level"].append(dep_copy)
+        source_id, target_id = dep["source_id"], dep["target_id"]
+        if source_id.startswith("exasol:") and target_id.startswith("exasol:"):
+            merged["dependencies"]["table_level"].append(dep)
+            continue
+        merged["dependencies"]["table_level"].append({
+            **dep,
+            "source_id": source_id if source_id.startswith("exasol:") else f"exasol:{source_id}",
+            "target_id": target_id if target_id.startswith("exasol:") else f"exasol:{target_id}",
+        })
 
     # Add BigQuery dependencies
     merged["dependencies"]["table_level"].extend(
@@ -781,12 +1062,15 @@ def merge_caches(exasol_cache: dict, bigquery_cache: dict) -> dict:
 
     # Merge column-level dependencies (update IDs for Exasol)
     for col_dep in exasol_cache.get("dependencies", {}).get("column_level", []):
-        dep_copy = col_dep.copy()
-        if not dep_copy["source_object_id"].startswith("exasol:"):
-            dep_copy["source_object_id"] = f"exasol:{dep_copy['source_object_id']}"
-        if not dep_copy["target_object_id"].startswith("exasol:"):
-            dep_copy["target_object_id"] = f"exasol:{dep_copy['target_object_id']}"
-        merged["dependencies"]["column_level"].append(dep_copy)
+        source_id, target_id = col_dep["source_object_id"], col_dep["target_object_id"]
+        if source_id.startswith("exasol:") and target_id.startswith("exasol:"):
+            merged["dependencies"]["column_level"].append(col_dep)
+            continue
+        merged["dependencies"]["column_level"].append({
+            **col_dep,
+            "source_object_id": source_id if source_id.startswith("exasol:") else f"exasol:{source_id}",
+            "target_object_id": target_id if target_id.startswith("exasol:") else f"exasol:{target_id}",
+        })
 
     # Add BigQuery column-level dependencies
     merged["dependencies"]["column_level"].extend(
@@ -801,6 +1085,28 @@ def merge_caches(exasol_cache: dict, bigquery_cache: dict) -> dict:
     return merged
 
 
+def write_cache(cache: dict, output_path: Path, pretty: bool = True) -> None:
+    """
+    Write the cache as JSON.
+
+    Objects held in a SpilledObjectStore are streamed one at a time (one compact
+    object per line) so the full object map is never materialized in memory.
+    """
+    objects = cache["objects"]
+    if not isinstance(objects, SpilledObjectStore):
+        with open(output_path, "wb") as f:
+            f.write(dumps(cache, pretty))
+        return
+
+    with open(output_path, "wb") as f:
+        f.write(b'{"metadata": ' + dumps(cache["metadata"]) + b',\n"objects": {')
+        separator = b"\n"
+        for object_id, value in objects.raw_items():
+            f.write(separator + dumps(object_id) + b": " + value)
+            separator = b",\n"
+        f.write(b'\n},\n"dependencies": ' + dumps(cache["dependencies"]) + b"}\n")
+
+
 def load_config(config_path: Path) -> dict:
     """Load configuration from YAML file."""
     if not config_path.exists():
@@ -811,6 +1117,7 @@ def load_config(config_path: Path) -> dict:
             "connection": {
                 "project_id": "your-gcp-project-id",
                 "credentials_file": "path/to/service-account.json",
+                "region": "region-us",
             },
             "extraction": {
                 "datasets": [],  # Empty = all datasets
@@ -873,8 +1180,7 @@ def main():
     # Optionally merge with Exasol cache
     if args.merge_with and args.merge_with.exists():
         print(f"\nMerging with Exasol cache: {args.merge_with}")
-        with open(args.merge_with, "r") as f:
-            exasol_cache = json.load(f)
+        exasol_cache = loads(args.merge_with.read_bytes())
         cache = merge_caches(exasol_cache, cache)
 
     # Determine output path
@@ -884,8 +1190,9 @@ def main():
 
     # Write cache
     pretty = config.get("output", {}).get("pretty_print", True)
-    with open(output_path, "w") as f:
-        json.dump(cache, f, indent=2 if pretty else None, default=str)
+    write_cache(cache, output_path, pretty)
+    if isinstance(extractor.objects, SpilledObjectStore):
+        extractor.objects.close()
 
     print("\n" + "=" * 60)
     print("Extraction Complete!")
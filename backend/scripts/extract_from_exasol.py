@@ -14,12 +14,19 @@ Requirements:
 """
 
 import argparse
-import json
+import hashlib
+from collections import Counter, defaultdict
 import os
+import re
 import sys
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime
+from itertools import groupby
+from operator import itemgetter
 from pathlib import Path
-from typing import Dict, List, Optional, Set, Any
+from typing import Dict, Iterator, List, Optional, Set, Any
 
 try:
     import yaml
@@ -34,6 +41,15 @@ except ImportError:
     print("Note: pyexasol requires Exasol ODBC driver or websocket connection")
     sys.exit(1)
 
+# Optional: pandas enables pyexasol's HTTP transport (export_to_pandas) for bulk metadata reads
+try:
+    import pandas  # noqa: F401
+    HAS_PANDAS = True
+except ImportError:
+    HAS_PANDAS = False
+
+from common import PARALLEL_PARSE_THRESHOLD, write_json_stream
+
 # Import AST-based parser
 try:
     from script_parser import parse_script, SQLParser
@@ -51,6 +67,189 @@ except ImportError:
     print("Warning: column_lineage_parser not found. Column-level lineage will be limited.")
 
 
+_TABLE_NAME = r'([A-Za-z_][A-Za-z0-9_]*(?:\.[A-Za-z_][A-Za-z0-9_]*)?)'
+
+# (pattern, reference_type) pairs for the regex fallback parser, compiled once
+_FALLBACK_PATTERNS = [
+    # DDL - CREATE TABLE first to catch CREATE TABLE x AS SELECT
+    (re.compile(r'\bCREATE\s+(?:OR\s+REPLACE\s+)?TABLE\s+' + _TABLE_NAME, re.IGNORECASE), 'DDL'),
+    (re.compile(r'\bFROM\s+' + _TABLE_NAME, re.IGNORECASE), 'SELECT'),
+    (re.compile(r'\bJOIN\s+' + _TABLE_NAME, re.IGNORECASE), 'JOIN'),
+    (re.compile(r'\bINTO\s+' + _TABLE_NAME, re.IGNORECASE), 'INSERT'),
+    (re.compile(r'\bUPDATE\s+' + _TABLE_NAME, re.IGNORECASE), 'UPDATE'),
+    (re.compile(r'\bMERGE\s+INTO\s+' + _TABLE_NAME, re.IGNORECASE), 'MERGE'),
+    (re.compile(r'\bDELETE\s+FROM\s+' + _TABLE_NAME, re.IGNORECASE), 'DELETE'),
+    (re.compile(r'\bTRUNCATE\s+TABLE\s+' + _TABLE_NAME, re.IGNORECASE), 'DDL'),
+    (re.compile(r'\bDROP\s+TABLE\s+' + _TABLE_NAME, re.IGNORECASE), 'DDL'),
+]
+
+# Regular (unquoted) identifiers, for tokenizing uppercased view definitions
+_IDENTIFIER = re.compile(r'[A-Z_][A-Z0-9_]*')
+
+
+@dataclass(slots=True)
+class Dep:
+    """A table-level dependency; serialized as a JSON object with these four keys."""
+    source_id: str
+    target_id: str
+    dependency_type: str
+    reference_type: str
+
+
+# Object ids known to a parse worker process, set once by _init_parse_worker.
+# A dict rather than a set: parse_script takes the first name match, so order matters.
+_worker_known_objects: Optional[dict] = None
+
+
+def _definition_key(definition: str) -> bytes:
+    """Digest identifying a SQL text, used to parse identical definitions once."""
+    return hashlib.blake2b(definition.encode("utf-8"), digest_size=16).digest()
+
+
+def _init_parse_worker(known_objects: dict) -> None:
+    """Process pool initializer: receive the known object ids once per worker."""
+    global _worker_known_objects
+    _worker_known_objects = known_objects
+
+
+def _parse_view_job(definition: str) -> list:
+    """Process pool task: parse one view definition into table references."""
+    return parse_script(definition, "SQL", _worker_known_objects)
+
+
+def _parse_script_job(job: tuple) -> list:
+    """Process pool task: parse one (script_text, language) pair into table references."""
+    script_text, language = job
+    return parse_script(script_text, language, _worker_known_objects)
+
+
+# System table queries. All are compatible with Exasol 7.1+, which lacks the
+# CREATED / RAW_OBJECT_SIZE columns on most of these tables.
+CONNECTIONS_QUERY = """
+SELECT
+    CONNECTION_NAME,
+    CONNECTION_STRING,
+    USER_NAME,
+    CREATED,
+    CONNECTION_COMMENT
+FROM EXA_DBA_CONNECTIONS
+"""
+
+# Exasol 7.1 uses different column names here
+VIRTUAL_SCHEMAS_QUERY = """
+SELECT
+    SCHEMA_NAME,
+    SCHEMA_OWNER,
+    ADAPTER_SCRIPT,
+    ADAPTER_NOTES,
+    SCHEMA_OBJECT_ID
+FROM EXA_ALL_VIRTUAL_SCHEMAS
+"""
+
+TABLES_QUERY = """
+SELECT
+    TABLE_SCHEMA,
+    TABLE_NAME,
+    TABLE_OWNER,
+    TABLE_COMMENT,
+    TABLE_ROW_COUNT,
+    TABLE_OBJECT_ID
+FROM EXA_ALL_TABLES
+ORDER BY TABLE_SCHEMA, TABLE_NAME
+"""
+
+VIEWS_QUERY = """
+SELECT
+    VIEW_SCHEMA,
+    VIEW_NAME,
+    VIEW_OWNER,
+    VIEW_TEXT,
+    VIEW_COMMENT,
+    VIEW_OBJECT_ID
+FROM EXA_ALL_VIEWS
+ORDER BY VIEW_SCHEMA, VIEW_NAME
+"""
+
+# With extract_columns, tables and views are fetched joined to their columns:
+# one row per column (or a single row with NULL columns for objects without
+# any), ordered so that each object's rows are adjacent.
+TABLES_WITH_COLUMNS_QUERY = """
+SELECT
+    t.TABLE_SCHEMA,
+    t.TABLE_NAME,
+    t.TABLE_OWNER,
+    t.TABLE_COMMENT,
+    t.TABLE_ROW_COUNT,
+    t.TABLE_OBJECT_ID,
+    c.COLUMN_NAME,
+    c.COLUMN_TYPE,
+    c.COLUMN_ORDINAL_POSITION,
+    c.COLUMN_IS_NULLABLE,
+    c.COLUMN_COMMENT
+FROM EXA_ALL_TABLES t
+LEFT JOIN EXA_ALL_COLUMNS c
+    ON c.COLUMN_SCHEMA = t.TABLE_SCHEMA
+    AND c.COLUMN_TABLE = t.TABLE_NAME
+    AND c.COLUMN_OBJECT_TYPE = 'TABLE'
+ORDER BY t.TABLE_SCHEMA, t.TABLE_NAME, c.COLUMN_ORDINAL_POSITION
+"""
+
+# VIEW_TEXT is only sent on each view's first row rather than once per column
+VIEWS_WITH_COLUMNS_QUERY = """
+SELECT
+    v.VIEW_SCHEMA,
+    v.VIEW_NAME,
+    v.VIEW_OWNER,
+    CASE WHEN c.COLUMN_ORDINAL_POSITION IS NULL OR c.COLUMN_ORDINAL_POSITION = 1
+        THEN v.VIEW_TEXT END AS VIEW_TEXT,
+    v.VIEW_COMMENT,
+    v.VIEW_OBJECT_ID,
+    c.COLUMN_NAME,
+    c.COLUMN_TYPE,
+    c.COLUMN_ORDINAL_POSITION,
+    c.COLUMN_IS_NULLABLE,
+    c.COLUMN_COMMENT
+FROM EXA_ALL_VIEWS v
+LEFT JOIN EXA_ALL_COLUMNS c
+    ON c.COLUMN_SCHEMA = v.VIEW_SCHEMA
+    AND c.COLUMN_TABLE = v.VIEW_NAME
+    AND c.COLUMN_OBJECT_TYPE = 'VIEW'
+ORDER BY v.VIEW_SCHEMA, v.VIEW_NAME, c.COLUMN_ORDINAL_POSITION
+"""
+
+SCRIPTS_QUERY = """
+SELECT
+    SCRIPT_SCHEMA,
+    SCRIPT_NAME,
+    SCRIPT_OWNER,
+    SCRIPT_TYPE,
+    SCRIPT_INPUT_TYPE,
+    SCRIPT_RESULT_TYPE,
+    SCRIPT_TEXT,
+    SCRIPT_COMMENT,
+    SCRIPT_LANGUAGE,
+    SCRIPT_OBJECT_ID
+FROM EXA_ALL_SCRIPTS
+WHERE SCRIPT_LANGUAGE IN ('LUA', 'PYTHON')
+ORDER BY SCRIPT_SCHEMA, SCRIPT_NAME
+"""
+
+# Exasol 7.1 compatible - uses REFERENCE_TYPE not DEPENDENCY_TYPE.
+# Only the dependent side (OBJECT_SCHEMA) is schema-filtered; referenced objects
+# may also be connections or other objects extracted outside the filtered phases.
+DEPENDENCIES_QUERY = """
+SELECT
+    REFERENCED_OBJECT_SCHEMA,
+    REFERENCED_OBJECT_NAME,
+    REFERENCED_OBJECT_TYPE,
+    OBJECT_SCHEMA,
+    OBJECT_NAME,
+    OBJECT_TYPE,
+    REFERENCE_TYPE
+FROM EXA_DBA_DEPENDENCIES
+"""
+
+
 class ExasolLineageExtractor:
     """
     Extracts lineage data from Exasol database using system tables:
@@ -65,13 +264,42 @@ class ExasolLineageExtractor:
     def __init__(self, config: dict):
         self.config = config
         self.conn = None
+        extraction = config.get("extraction", {})
+        self._include_schemas: Set[str] = set(extraction.get("include_schemas") or [])
+        self._exclude_schemas: Set[str] = set(extraction.get("exclude_schemas") or [])
+        # System table queries with the schema filter pushed down, by phase
+        self._queries = self._build_queries()
         self.objects: Dict[str, dict] = {}
-        self.table_deps: List[dict] = []
+        # Live, copy-free view of the object ids, passed to parse_script for validation
+        self._known_objects = self.objects.keys()
+        self.table_deps: List[Dep] = []
         self.column_deps: List[dict] = []
+        # (source object, source column, target object, target column) of every column dep
+        self._column_dep_index: Set[tuple] = set()
+        # (source_id, target_id, dependency_type) of every dep in table_deps
+        self._dep_index: Set[tuple] = set()
+        # Views that EXA_DBA_DEPENDENCIES lists dependencies for
+        self._sys_covered_views: Set[str] = set()
+        # Bare object name -> ids ending in that name, in insertion order
+        self._name_index: Dict[str, List[str]] = {}
+        # Number of objects per type, for the per-phase summaries
+        self._type_counts: Counter = Counter()
         self.object_counter = 100000
+        # Run timestamp: generated_at, and created_at for objects without one
+        self._now = datetime.now()
+        # Metadata queries running ahead on worker sessions, keyed by query text
+        self._prefetch_pool: Optional[ThreadPoolExecutor] = None
+        self._prefetched: Dict[str, Future] = {}
+        self._worker_local = threading.local()
+        self._worker_conns: List[Any] = []
+        self._worker_conns_lock = threading.Lock()
 
     def connect(self) -> None:
         """Establish connection to Exasol database."""
+        self.conn = self._open_connection(verbose=True)
+
+    def _open_connection(self, verbose: bool = False) -> "pyexasol.ExaConnection":
+        """Open a new Exasol session using the connection config."""
         conn_config = self.config["connection"]
 
         # Get password from config or environment variable
@@ -85,17 +313,28 @@ class ExasolLineageExtractor:
 
         dsn = f"{conn_config['host']}:{conn_config['port']}"
 
-        print(f"Connecting to Exasol at {dsn}...")
-        self.conn = pyexasol.connect(
+        if verbose:
+            print(f"Connecting to Exasol at {dsn}...")
+        conn = pyexasol.connect(
             dsn=dsn,
             user=conn_config["user"],
             password=password,
             schema=conn_config.get("schema", ""),
         )
-        print("Connected successfully!")
+        if verbose:
+            print("Connected successfully!")
+        return conn
 
     def disconnect(self) -> None:
-        """Close database connection."""
+        """Close database connection (and any prefetch worker sessions)."""
+        if self._prefetch_pool:
+            self._prefetch_pool.shutdown(wait=True, cancel_futures=True)
+            self._prefetch_pool = None
+        self._prefetched.clear()
+        for conn in self._worker_conns:
+            conn.close()
+        self._worker_conns.clear()
+
         if self.conn:
             self.conn.close()
             print("Disconnected from Exasol.")
@@ -108,6 +347,10 @@ class ExasolLineageExtractor:
             extraction_config = self.config.get("extraction", {})
             object_types = extraction_config.get("object_types", {})
 
+            # Start the system table queries concurrently; the phases below consume
+            # their results in order, so output is the same as a serial run
+            self._prefetch_queries(extraction_config, object_types)
+
             # Extract each object type
             if object_types.get("connections", True):
                 self._extract_connections()
@@ -127,12 +370,19 @@ class ExasolLineageExtractor:
             # Extract scripts from custom metadata tables
             self._extract_metadata_scripts()
 
+            # With prefer_sys_dependencies the system table is read first, so views
+            # it already covers can skip the AST parse
+            prefer_sys_dependencies = extraction_config.get("prefer_sys_dependencies", False)
+            if prefer_sys_dependencies:
+                self._extract_dependencies()
+
             # Parse view definitions for dependencies (using AST parser)
             if self.config.get("script_parsing", {}).get("enabled", True):
                 self._parse_view_definitions()
 
             # Extract dependencies from system table
-            self._extract_dependencies()
+            if not prefer_sys_dependencies:
+                self._extract_dependencies()
 
             # Extract column-level lineage (enabled by default for column lineage UI)
             if extraction_config.get("extract_column_lineage", True):
@@ -143,52 +393,150 @@ class ExasolLineageExtractor:
         finally:
             self.disconnect()
 
+    def _prefetch_queries(self, extraction_config: dict, object_types: dict) -> None:
+        """
+        Submit the system table queries of all enabled phases to a thread pool.
+
+        Each worker thread runs its queries on its own session, so network and
+        Exasol execution time overlap instead of adding up. Disabled with
+        extraction.max_connections: 1.
+        """
+        max_connections = extraction_config.get("max_connections", 4)
+        if max_connections <= 1:
+            return
+
+        extract_columns = extraction_config.get("extract_columns", True)
+        jobs = []
+        if object_types.get("connections", True):
+            jobs.append((self._queries["connections"], False))
+        if object_types.get("virtual_schemas", True):
+            jobs.append((self._queries["virtual_schemas"], False))
+        if object_types.get("tables", True):
+            jobs.append((self._queries["tables_with_columns" if extract_columns else "tables"], True))
+        if object_types.get("views", True):
+            jobs.append((self._queries["views_with_columns" if extract_columns else "views"], True))
+        if object_types.get("lua_udfs", True):
+            jobs.append((self._queries["scripts"], False))
+        jobs.append((self._queries["dependencies"], True))
+
+        self._prefetch_pool = ThreadPoolExecutor(max_workers=min(max_connections, len(jobs)))
+        for query, bulk in jobs:
+            self._prefetched[query] = self._prefetch_pool.submit(self._fetch_all, query, bulk)
+
+    def _fetch_all(self, query: str, bulk: bool) -> list:
+        """Prefetch worker: run a query on this thread's own session and return all rows."""
+        conn = getattr(self._worker_local, "conn", None)
+        if conn is None:
+            conn = self._worker_local.conn = self._open_connection()
+            with self._worker_conns_lock:
+                self._worker_conns.append(conn)
+        return list(self._run_query(conn, query, bulk))
+
+    def _query_rows(self, query: str, bulk: bool = False):
+        """
+        Return the rows of a metadata query as positional tuples.
+
+        Uses the prefetched result when the query was started ahead of time
+        (re-raising its error, if any), otherwise runs it on the main session.
+        """
+        future = self._prefetched.pop(query, None)
+        if future is not None:
+            return future.result()
+        return self._run_query(self.conn, query, bulk)
+
+    def _run_query(self, conn, query: str, bulk: bool = False):
+        """
+        Run a query on conn.
+
+        For bulk queries with extraction.use_http_transport enabled (and pandas
+        installed), the result is streamed through pyexasol's HTTP transport instead
+        of being fetched in WebSocket chunks, which is much faster for large catalogs.
+        NULLs come back as None either way.
+        """
+        if bulk and self.config.get("extraction", {}).get("use_http_transport", False) and HAS_PANDAS:
+            try:
+                df = conn.export_to_pandas(query)
+                # A NULL in an integer column (e.g. the LEFT JOIN row of a table without
+                # columns) makes pandas read it as float64; nullable Int64 keeps the
+                # values as ints, matching what execute returns
+                df = df.convert_dtypes(convert_string=False)
+                df = df.astype(object).where(df.notna(), None)
+                return df.itertuples(index=False, name=None)
+            except Exception as e:
+                print(f"  Warning: HTTP transport failed, falling back to execute: {e}")
+        return conn.execute(query)
+
     def _should_include_schema(self, schema: str) -> bool:
-        """Check if schema should be included based on config."""
-        extraction = self.config.get("extraction", {})
-        include = extraction.get("include_schemas", [])
-        exclude = extraction.get("exclude_schemas", [])
+        """
+        Check if schema should be included based on config.
 
-        if include and schema not in include:
+        The queries already filter on schema server-side; this stays as a cheap
+        safety net for rows that reach Python anyway.
+        """
+        if self._include_schemas and schema not in self._include_schemas:
             return False
-        if schema in exclude:
+        if schema in self._exclude_schemas:
             return False
         return True
 
+    def _schema_predicate(self, column: str) -> str:
+        """SQL condition on column equivalent to _should_include_schema ("" if no filter)."""
+        def sql_list(names: Set[str]) -> str:
+            return ", ".join("'" + name.replace("'", "''") + "'" for name in sorted(names))
+
+        conditions = []
+        if self._include_schemas:
+            conditions.append(f"{column} IN ({sql_list(self._include_schemas)})")
+        if self._exclude_schemas:
+            conditions.append(f"{column} NOT IN ({sql_list(self._exclude_schemas)})")
+        return " AND ".join(conditions)
+
+    def _with_schema_filter(self, query: str, column: str) -> str:
+        """Add the schema filter on column to one of the module's query templates."""
+        predicate = self._schema_predicate(column)
+        if not predicate:
+            return query
+        head, order_by, tail = query.partition("ORDER BY")
+        keyword = "AND" if "WHERE" in head else "WHERE"
+        return f"{head.rstrip()}\n{keyword} {predicate}\n{order_by}{tail}"
+
+    def _build_queries(self) -> Dict[str, str]:
+        """Return the system table query of each phase, filtered to the configured schemas."""
+        return {
+            "connections": CONNECTIONS_QUERY,
+            "virtual_schemas": self._with_schema_filter(VIRTUAL_SCHEMAS_QUERY, "SCHEMA_NAME"),
+            "tables": self._with_schema_filter(TABLES_QUERY, "TABLE_SCHEMA"),
+            "tables_with_columns": self._with_schema_filter(TABLES_WITH_COLUMNS_QUERY, "t.TABLE_SCHEMA"),
+            "views": self._with_schema_filter(VIEWS_QUERY, "VIEW_SCHEMA"),
+            "views_with_columns": self._with_schema_filter(VIEWS_WITH_COLUMNS_QUERY, "v.VIEW_SCHEMA"),
+            "scripts": self._with_schema_filter(SCRIPTS_QUERY, "SCRIPT_SCHEMA"),
+            "dependencies": self._with_schema_filter(DEPENDENCIES_QUERY, "OBJECT_SCHEMA"),
+        }
+
     def _extract_connections(self) -> None:
         """Extract connection objects."""
         print("Extracting connections...")
 
-        query = """
-        SELECT
-            CONNECTION_NAME,
-            CONNECTION_STRING,
-            USER_NAME,
-            CREATED,
-            CONNECTION_COMMENT
-        FROM EXA_DBA_CONNECTIONS
-        """
-
         try:
-            result = self.conn.execute(query)
+            result = self._query_rows(self._queries["connections"])
             for row in result:
                 conn_name = row[0]
                 conn_id = f"SYS.{conn_name}"
 
-                self.objects[conn_id] = {
+                self._add_object({
                     "id": conn_id,
                     "schema": "SYS",
                     "name": conn_name,
                     "type": "CONNECTION",
                     "owner": "SYS",
                     "object_id": self._next_id(),
-                    "created_at": row[3].isoformat() if row[3] else datetime.now().isoformat(),
+                    "created_at": row[3] or self._now,
                     "description": row[4] or f"Connection {conn_name}",
                     "connection_string": row[1] or "",
                     "user": row[2] or "",
-                }
+                })
 
-            print(f"  Found {len([o for o in self.objects.values() if o['type'] == 'CONNECTION'])} connections")
+            print(f"  Found {self._type_counts['CONNECTION']} connections")
         except Exception as e:
             print(f"  Warning: Could not extract connections: {e}")
 
@@ -196,19 +544,8 @@ class ExasolLineageExtractor:
         """Extract virtual schema objects."""
         print("Extracting virtual schemas...")
 
-        # Compatible with Exasol 7.1+ (different column names, no CREATED)
-        query = """
-        SELECT
-            SCHEMA_NAME,
-            SCHEMA_OWNER,
-            ADAPTER_SCRIPT,
-            ADAPTER_NOTES,
-            SCHEMA_OBJECT_ID
-        FROM EXA_ALL_VIRTUAL_SCHEMAS
-        """
-
         try:
-            result = self.conn.execute(query)
+            result = self._query_rows(self._queries["virtual_schemas"])
             for row in result:
                 schema_name = row[0]
                 if not self._should_include_schema(schema_name):
@@ -216,19 +553,19 @@ class ExasolLineageExtractor:
 
                 vs_id = f"{schema_name}.VIRTUAL_SCHEMA"
 
-                self.objects[vs_id] = {
+                self._add_object({
                     "id": vs_id,
                     "schema": schema_name,
                     "name": "VIRTUAL_SCHEMA",
                     "type": "VIRTUAL_SCHEMA",
                     "owner": row[1] or "UNKNOWN",
                     "object_id": row[4] if row[4] else self._next_id(),
-                    "created_at": datetime.now().isoformat(),  # Not available in 7.1
+                    "created_at": self._now,  # Not available in 7.1
                     "description": row[3] or f"Virtual schema {schema_name}",
                     "adapter_name": row[2],  # Full adapter script path
-                }
+                })
 
-            print(f"  Found {len([o for o in self.objects.values() if o['type'] == 'VIRTUAL_SCHEMA'])} virtual schemas")
+            print(f"  Found {self._type_counts['VIRTUAL_SCHEMA']} virtual schemas")
         except Exception as e:
             print(f"  Warning: Could not extract virtual schemas: {e}")
 
@@ -236,192 +573,116 @@ class ExasolLineageExtractor:
         """Extract table objects with columns."""
         print("Extracting tables...")
 
-        # Get tables - compatible with Exasol 7.1+
-        # Note: RAW_OBJECT_SIZE and CREATED columns not available in 7.1
-        table_query = """
-        SELECT
-            TABLE_SCHEMA,
-            TABLE_NAME,
-            TABLE_OWNER,
-            TABLE_COMMENT,
-            TABLE_ROW_COUNT,
-            TABLE_OBJECT_ID
-        FROM EXA_ALL_TABLES
-        ORDER BY TABLE_SCHEMA, TABLE_NAME
-        """
+        # Columns are enabled by default for column lineage
+        extract_columns = self.config.get("extraction", {}).get("extract_columns", True)
+        query = self._queries["tables_with_columns" if extract_columns else "tables"]
+        result = self._query_rows(query, bulk=True)
 
-        tables_by_schema: Dict[str, List] = {}
-
-        result = self.conn.execute(table_query)
-        for row in result:
+        for row, column_rows in self._group_column_rows(result, extract_columns):
             schema_name = row[0]
             if not self._should_include_schema(schema_name):
                 continue
 
-            if schema_name not in tables_by_schema:
-                tables_by_schema[schema_name] = []
-            tables_by_schema[schema_name].append(row)
-
-        # Get columns for all tables at once (enabled by default for column lineage)
-        columns_map: Dict[str, List[dict]] = {}
-        extraction_config = self.config.get("extraction", {})
-        if extraction_config.get("extract_columns", True):
-            column_query = """
-            SELECT
-                COLUMN_SCHEMA,
-                COLUMN_TABLE,
-                COLUMN_NAME,
-                COLUMN_TYPE,
-                COLUMN_ORDINAL_POSITION,
-                COLUMN_IS_NULLABLE,
-                COLUMN_COMMENT
-            FROM EXA_ALL_COLUMNS
-            WHERE COLUMN_OBJECT_TYPE = 'TABLE'
-            ORDER BY COLUMN_SCHEMA, COLUMN_TABLE, COLUMN_ORDINAL_POSITION
-            """
-
-            result = self.conn.execute(column_query)
-            for row in result:
-                key = f"{row[0]}.{row[1]}"
-                if key not in columns_map:
-                    columns_map[key] = []
-                columns_map[key].append({
-                    "name": row[2],
-                    "data_type": row[3],
-                    "ordinal_position": row[4],
-                    "is_nullable": row[5],
-                    "is_primary_key": False,  # Would need to query constraints
-                    "description": row[6],
-                })
+            table_name = row[1]
+            table_id = f"{schema_name}.{table_name}"
 
-        # Build table objects
-        for schema_name, tables in tables_by_schema.items():
-            for row in tables:
-                table_name = row[1]
-                table_id = f"{schema_name}.{table_name}"
+            self._add_object({
+                "id": table_id,
+                "schema": schema_name,
+                "name": table_name,
+                "type": "TABLE",
+                "owner": row[2] or "UNKNOWN",
+                "object_id": row[5] if row[5] else self._next_id(),
+                "created_at": self._now,  # Not available in 7.1
+                "description": row[3],
+                "columns": [
+                    {
+                        "name": col[6],
+                        "data_type": col[7],
+                        "ordinal_position": col[8],
+                        "is_nullable": col[9],
+                        "is_primary_key": False,  # Would need to query constraints
+                        "description": col[10],
+                    }
+                    for col in column_rows
+                ],
+                "row_count": row[4],
+                "size_bytes": None,  # Not available in 7.1
+            })
 
-                self.objects[table_id] = {
-                    "id": table_id,
-                    "schema": schema_name,
-                    "name": table_name,
-                    "type": "TABLE",
-                    "owner": row[2] or "UNKNOWN",
-                    "object_id": row[5] if row[5] else self._next_id(),
-                    "created_at": datetime.now().isoformat(),  # Not available in 7.1
-                    "description": row[3],
-                    "columns": columns_map.get(table_id, []),
-                    "row_count": row[4],
-                    "size_bytes": None,  # Not available in 7.1
-                }
-
-        print(f"  Found {len([o for o in self.objects.values() if o['type'] == 'TABLE'])} tables")
+        print(f"  Found {self._type_counts['TABLE']} tables")
 
     def _extract_views(self) -> None:
         """Extract view objects with columns and definitions."""
         print("Extracting views...")
 
-        # Compatible with Exasol 7.1+ (no CREATED column)
-        view_query = """
-        SELECT
-            VIEW_SCHEMA,
-            VIEW_NAME,
-            VIEW_OWNER,
-            VIEW_TEXT,
-            VIEW_COMMENT,
-            VIEW_OBJECT_ID
-        FROM EXA_ALL_VIEWS
-        ORDER BY VIEW_SCHEMA, VIEW_NAME
-        """
-
-        views_by_schema: Dict[str, List] = {}
+        # Columns are enabled by default for column lineage
+        extract_columns = self.config.get("extraction", {}).get("extract_columns", True)
+        query = self._queries["views_with_columns" if extract_columns else "views"]
+        result = self._query_rows(query, bulk=True)
 
-        result = self.conn.execute(view_query)
-        for row in result:
+        for row, column_rows in self._group_column_rows(result, extract_columns):
             schema_name = row[0]
             if not self._should_include_schema(schema_name):
                 continue
 
-            if schema_name not in views_by_schema:
-                views_by_schema[schema_name] = []
-            views_by_schema[schema_name].append(row)
-
-        # Get columns for all views (enabled by default for column lineage)
-        columns_map: Dict[str, List[dict]] = {}
-        extraction_config = self.config.get("extraction", {})
-        if extraction_config.get("extract_columns", True):
-            column_query = """
-            SELECT
-                COLUMN_SCHEMA,
-                COLUMN_TABLE,
-                COLUMN_NAME,
-                COLUMN_TYPE,
-                COLUMN_ORDINAL_POSITION,
-                COLUMN_IS_NULLABLE,
-                COLUMN_COMMENT
-            FROM EXA_ALL_COLUMNS
-            WHERE COLUMN_OBJECT_TYPE = 'VIEW'
-            ORDER BY COLUMN_SCHEMA, COLUMN_TABLE, COLUMN_ORDINAL_POSITION
-            """
-
-            result = self.conn.execute(column_query)
-            for row in result:
-                key = f"{row[0]}.{row[1]}"
-                if key not in columns_map:
-                    columns_map[key] = []
-                columns_map[key].append({
-                    "name": row[2],
-                    "data_type": row[3],
-                    "ordinal_position": row[4],
-                    "is_nullable": row[5],
-                    "is_primary_key": False,
-                    "description": row[6],
-                    "source_columns": [],
-                })
+            view_name = row[1]
+            view_id = f"{schema_name}.{view_name}"
+
+            self._add_object({
+                "id": view_id,
+                "schema": schema_name,
+                "name": view_name,
+                "type": "VIEW",
+                "owner": row[2] or "UNKNOWN",
+                "object_id": row[5] if row[5] else self._next_id(),
+                "created_at": self._now,  # Not available in 7.1
+                "description": row[4],
+                "definition": row[3],
+                "columns": [
+                    {
+                        "name": col[6],
+                        "data_type": col[7],
+                        "ordinal_position": col[8],
+                        "is_nullable": col[9],
+                        "is_primary_key": False,
+                        "description": col[10],
+                        "source_columns": [],
+                    }
+                    for col in column_rows
+                ],
+            })
 
-        # Build view objects
-        for schema_name, views in views_by_schema.items():
-            for row in views:
-                view_name = row[1]
-                view_id = f"{schema_name}.{view_name}"
+        print(f"  Found {self._type_counts['VIEW']} views")
 
-                self.objects[view_id] = {
-                    "id": view_id,
-                    "schema": schema_name,
-                    "name": view_name,
-                    "type": "VIEW",
-                    "owner": row[2] or "UNKNOWN",
-                    "object_id": row[5] if row[5] else self._next_id(),
-                    "created_at": datetime.now().isoformat(),  # Not available in 7.1
-                    "description": row[4],
-                    "definition": row[3],
-                    "columns": columns_map.get(view_id, []),
-                }
-
-        print(f"  Found {len([o for o in self.objects.values() if o['type'] == 'VIEW'])} views")
+    @staticmethod
+    def _group_column_rows(result, with_columns: bool) -> Iterator[tuple]:
+        """
+        Yield (object_row, column_rows) for each object of a table/view query.
+
+        Joined results have one row per column, adjacent per (schema, name), so
+        they are grouped while streaming; the object fields come from the first
+        row. Objects without columns come back as one row with NULL column fields.
+        """
+        if not with_columns:
+            for row in result:
+                yield row, ()
+            return
+
+        for _, rows in groupby(result, key=itemgetter(0, 1)):
+            first = next(rows)
+            column_rows = [first, *rows] if first[6] is not None else []
+            yield first, column_rows
 
     def _extract_scripts(self) -> None:
         """Extract Lua UDF scripts."""
         print("Extracting Lua scripts...")
 
-        # Compatible with Exasol 7.1+ (no CREATED column)
-        script_query = """
-        SELECT
-            SCRIPT_SCHEMA,
-            SCRIPT_NAME,
-            SCRIPT_OWNER,
-            SCRIPT_TYPE,
-            SCRIPT_INPUT_TYPE,
-            SCRIPT_RESULT_TYPE,
-            SCRIPT_TEXT,
-            SCRIPT_COMMENT,
-            SCRIPT_LANGUAGE,
-            SCRIPT_OBJECT_ID
-        FROM EXA_ALL_SCRIPTS
-        WHERE SCRIPT_LANGUAGE = 'LUA' OR SCRIPT_LANGUAGE = 'PYTHON'
-        ORDER BY SCRIPT_SCHEMA, SCRIPT_NAME
-        """
+        parse_scripts = self.config.get("script_parsing", {}).get("enabled", True)
+        # (script_id, script_text, language) of each script, parsed once all are known
+        pending: List[tuple] = []
 
-        result = self.conn.execute(script_query)
+        result = self._query_rows(self._queries["scripts"])
         for row in result:
             schema_name = row[0]
             if not self._should_include_schema(schema_name):
@@ -434,27 +695,54 @@ class ExasolLineageExtractor:
             script_type = row[3]  # SCALAR, SET, etc.
             language = row[8] or "LUA"
 
-            self.objects[script_id] = {
+            self._add_object({
                 "id": script_id,
                 "schema": schema_name,
                 "name": script_name,
                 "type": "LUA_UDF",
                 "owner": row[2] or "UNKNOWN",
                 "object_id": row[9] if row[9] else self._next_id(),
-                "created_at": datetime.now().isoformat(),  # Not available in 7.1
+                "created_at": self._now,  # Not available in 7.1
                 "description": row[7],
                 "udf_type": script_type,
                 "script_language": language,
                 "script_text": row[6],
                 "input_parameters": self._parse_input_type(row[4]),
                 "output_columns": self._parse_result_type(row[5]),
-            }
+            })
 
-            # Parse script for table references using AST parser
-            if self.config.get("script_parsing", {}).get("enabled", True):
-                self._parse_script_dependencies(script_id, row[6], language)
+            if parse_scripts and row[6]:
+                pending.append((script_id, row[6], language))
 
-        print(f"  Found {len([o for o in self.objects.values() if o['type'] == 'LUA_UDF'])} scripts")
+        print(f"  Found {self._type_counts['LUA_UDF']} scripts")
+
+        # Parse scripts for table references using AST parser
+        if pending:
+            self._parse_scripts(pending)
+
+    def _parse_scripts(self, scripts: List[tuple]) -> None:
+        """
+        Parse (script_id, script_text, language) triples for table references.
+
+        Like view definitions, large batches are parsed across CPU cores (AST
+        parsing holds the GIL, so threads would not help) while the dependencies
+        are still recorded here in script order.
+        """
+        max_workers = self.config.get("script_parsing", {}).get("max_workers")
+        if not HAS_AST_PARSER or len(scripts) < PARALLEL_PARSE_THRESHOLD or max_workers == 1:
+            for script_id, script_text, language in scripts:
+                self._parse_script_dependencies(script_id, script_text, language)
+            return
+
+        print(f"  Parsing {len(scripts)} scripts in parallel...")
+        with ProcessPoolExecutor(
+            max_workers=max_workers,
+            initializer=_init_parse_worker,
+            initargs=(dict.fromkeys(self.objects),),
+        ) as executor:
+            jobs = [(script_text, language) for _, script_text, language in scripts]
+            for (script_id, _, _), refs in zip(scripts, executor.map(_parse_script_job, jobs, chunksize=8)):
+                self._add_script_refs(script_id, refs)
 
     def _extract_metadata_scripts(self) -> None:
         """
@@ -555,20 +843,20 @@ class ExasolLineageExtractor:
                     script_id = f"{row_schema}.{row_name}"
 
                     # Add as object
-                    self.objects[script_id] = {
+                    self._add_object({
                         "id": script_id,
                         "schema": row_schema,
                         "name": row_name,
                         "type": "LUA_UDF" if language == "LUA" else "VIEW",  # Treat SQL as view-like
                         "owner": "METADATA",
                         "object_id": self._next_id(),
-                        "created_at": datetime.now().isoformat(),
+                        "created_at": self._now,
                         "description": f"Script from {table_name}",
                         "script_language": language,
                         "script_text": combined_script,
                         "source_table": table_name,
                         "source_id": row_id,
-                    }
+                    })
 
                     # Parse script for dependencies
                     self._parse_script_dependencies(script_id, combined_script, language)
@@ -579,6 +867,22 @@ class ExasolLineageExtractor:
             except Exception as e:
                 print(f"    Warning: Could not extract from {table_name}: {e}")
 
+    def _add_object(self, obj: dict) -> None:
+        """Store an extracted object, index it by bare name and count it by type."""
+        obj_id = obj["id"]
+        previous = self.objects.get(obj_id)
+        if previous is None:
+            self._name_index.setdefault(obj_id.rsplit(".", 1)[-1], []).append(obj_id)
+        else:
+            self._type_counts[previous["type"]] -= 1
+        self._type_counts[obj["type"]] += 1
+        self.objects[obj_id] = obj
+
+    def _find_by_name(self, name: str) -> Optional[str]:
+        """Return the first extracted object id whose bare name is name, if any."""
+        candidates = self._name_index.get(name)
+        return candidates[0] if candidates else None
+
     def _parse_input_type(self, input_type: str) -> List[dict]:
         """Parse script input type string into parameter list."""
         if not input_type:
@@ -618,81 +922,51 @@ class ExasolLineageExtractor:
 
         # Use AST-based parser if available
         if HAS_AST_PARSER:
-            known_objects = set(self.objects.keys())
-            refs = parse_script(script_text, language, known_objects)
-
-            for ref in refs:
-                # Ensure uppercase for matching against objects (Exasol uses uppercase)
-                table_id = ref.full_id().upper()
-
-                # Validate the reference exists in our objects
-                if table_id not in self.objects:
-                    # Try to find by name only (uppercase)
-                    ref_name_upper = ref.name.upper()
-                    found = False
-                    for obj_id in self.objects:
-                        if obj_id.endswith(f".{ref_name_upper}"):
-                            table_id = obj_id
-                            found = True
-                            break
-
-                    # For DDL (CREATE TABLE), the table might not exist yet - that's OK
-                    # For reads (SELECT/JOIN), skip unknown objects
-                    if not found and ref.reference_type != 'DDL':
-                        continue  # Skip unknown objects for reads
-
-                # Map reference type to dependency type
-                if ref.reference_type in ('INSERT', 'UPDATE', 'DELETE', 'MERGE', 'DDL'):
-                    # Script writes to this table (target is the table)
-                    # DDL includes CREATE TABLE AS SELECT - the created table is the output
-                    self.table_deps.append({
-                        "source_id": script_id,
-                        "target_id": table_id,
-                        "dependency_type": "UDF_OUTPUT",
-                        "reference_type": ref.reference_type,
-                    })
-                else:
-                    # Script reads from this table (source is the table)
-                    # SELECT, JOIN, etc. are inputs
-                    self.table_deps.append({
-                        "source_id": table_id,
-                        "target_id": script_id,
-                        "dependency_type": "UDF_INPUT",
-                        "reference_type": ref.reference_type,
-                    })
+            self._add_script_refs(script_id, parse_script(script_text, language, self._known_objects))
         else:
             # Fallback to basic regex (limited functionality)
             self._parse_script_dependencies_fallback(script_id, script_text)
 
+    def _add_script_refs(self, script_id: str, refs: list) -> None:
+        """Record the table references parsed from a script as UDF input/output dependencies."""
+        for ref in refs:
+            # Ensure uppercase for matching against objects (Exasol uses uppercase)
+            table_id = ref.full_id().upper()
+
+            # Validate the reference exists in our objects
+            if table_id not in self.objects:
+                # Try to find by name only (uppercase)
+                found_id = self._find_by_name(ref.name.upper())
+                if found_id:
+                    table_id = found_id
+
+                # For DDL (CREATE TABLE), the table might not exist yet - that's OK
+                # For reads (SELECT/JOIN), skip unknown objects
+                elif ref.reference_type != 'DDL':
+                    continue  # Skip unknown objects for reads
+
+            # Map reference type to dependency type
+            if ref.reference_type in ('INSERT', 'UPDATE', 'DELETE', 'MERGE', 'DDL'):
+                # Script writes to this table (target is the table)
+                # DDL includes CREATE TABLE AS SELECT - the created table is the output
+                self._add_dependency(script_id, table_id, "UDF_OUTPUT", ref.reference_type)
+            else:
+                # Script reads from this table (source is the table)
+                # SELECT, JOIN, etc. are inputs
+                self._add_dependency(table_id, script_id, "UDF_INPUT", ref.reference_type)
+
     def _parse_script_dependencies_fallback(self, script_id: str, script_text: str) -> None:
         """Fallback regex-based parsing when AST parser is not available."""
-        import re
-
-        patterns = [
-            # DDL - CREATE TABLE first to catch CREATE TABLE x AS SELECT
-            (r'\bCREATE\s+(?:OR\s+REPLACE\s+)?TABLE\s+([A-Za-z_][A-Za-z0-9_]*(?:\.[A-Za-z_][A-Za-z0-9_]*)?)', 'DDL'),
-            (r'\bFROM\s+([A-Za-z_][A-Za-z0-9_]*(?:\.[A-Za-z_][A-Za-z0-9_]*)?)', 'SELECT'),
-            (r'\bJOIN\s+([A-Za-z_][A-Za-z0-9_]*(?:\.[A-Za-z_][A-Za-z0-9_]*)?)', 'JOIN'),
-            (r'\bINTO\s+([A-Za-z_][A-Za-z0-9_]*(?:\.[A-Za-z_][A-Za-z0-9_]*)?)', 'INSERT'),
-            (r'\bUPDATE\s+([A-Za-z_][A-Za-z0-9_]*(?:\.[A-Za-z_][A-Za-z0-9_]*)?)', 'UPDATE'),
-            (r'\bMERGE\s+INTO\s+([A-Za-z_][A-Za-z0-9_]*(?:\.[A-Za-z_][A-Za-z0-9_]*)?)', 'MERGE'),
-            (r'\bDELETE\s+FROM\s+([A-Za-z_][A-Za-z0-9_]*(?:\.[A-Za-z_][A-Za-z0-9_]*)?)', 'DELETE'),
-            (r'\bTRUNCATE\s+TABLE\s+([A-Za-z_][A-Za-z0-9_]*(?:\.[A-Za-z_][A-Za-z0-9_]*)?)', 'DDL'),
-            (r'\bDROP\s+TABLE\s+([A-Za-z_][A-Za-z0-9_]*(?:\.[A-Za-z_][A-Za-z0-9_]*)?)', 'DDL'),
-        ]
-
         found_refs: Set[tuple] = set()
 
-        for pattern, ref_type in patterns:
+        for pattern, ref_type in _FALLBACK_PATTERNS:
             try:
-                matches = re.findall(pattern, script_text, re.IGNORECASE)
-                for match in matches:
-                    table_ref = match.strip().upper()
+                for match in pattern.finditer(script_text):
+                    table_ref = match.group(1).strip().upper()
                     if "." not in table_ref:
-                        for obj_id in self.objects:
-                            if obj_id.endswith(f".{table_ref}"):
-                                found_refs.add((obj_id, ref_type))
-                                break
+                        obj_id = self._find_by_name(table_ref)
+                        if obj_id:
+                            found_refs.add((obj_id, ref_type))
                     elif table_ref in self.objects:
                         found_refs.add((table_ref, ref_type))
                     elif ref_type == 'DDL':
@@ -703,19 +977,9 @@ class ExasolLineageExtractor:
 
         for table_id, ref_type in found_refs:
             if ref_type in ('INSERT', 'UPDATE', 'DELETE', 'MERGE', 'TRUNCATE', 'DDL'):
-                self.table_deps.append({
-                    "source_id": script_id,
-                    "target_id": table_id,
-                    "dependency_type": "UDF_OUTPUT",
-                    "reference_type": ref_type,
-                })
+                self._add_dependency(script_id, table_id, "UDF_OUTPUT", ref_type)
             else:
-                self.table_deps.append({
-                    "source_id": table_id,
-                    "target_id": script_id,
-                    "dependency_type": "UDF_INPUT",
-                    "reference_type": ref_type,
-                })
+                self._add_dependency(table_id, script_id, "UDF_INPUT", ref_type)
 
     def _parse_view_definitions(self) -> None:
         """
@@ -726,20 +990,32 @@ class ExasolLineageExtractor:
         """
         print("Parsing view definitions for dependencies...")
 
-        views = [o for o in self.objects.values() if o["type"] == "VIEW"]
+        views = [o for o in self.objects.values() if o["type"] == "VIEW" and o.get("definition")]
         dep_count = 0
 
-        for view in views:
-            definition = view.get("definition", "")
-            if not definition:
-                continue
+        # Views whose dependencies Exasol already reported need no parse (column
+        # lineage still parses them separately)
+        if self.config.get("extraction", {}).get("prefer_sys_dependencies", False):
+            uncovered = [v for v in views if v["id"] not in self._sys_covered_views]
+            print(f"  Skipping {len(views) - len(uncovered)} views covered by EXA_DBA_DEPENDENCIES")
+            views = uncovered
+
+        # References per distinct definition: generated views often share identical SQL.
+        # Objects don't change during this phase, so a cached result stays valid.
+        refs_by_definition: Dict[bytes, list] = {}
+        if HAS_AST_PARSER:
+            refs_by_definition = self._parse_views_in_parallel(views)
 
+        for view in views:
+            definition = view["definition"]
             view_id = view["id"]
 
             # Use AST parser to find table references
             if HAS_AST_PARSER:
-                known_objects = set(self.objects.keys())
-                refs = parse_script(definition, "SQL", known_objects)
+                key = _definition_key(definition)
+                refs = refs_by_definition.get(key)
+                if refs is None:
+                    refs = refs_by_definition[key] = parse_script(definition, "SQL", self._known_objects)
 
                 for ref in refs:
                     # Ensure uppercase for matching against objects (Exasol uses uppercase)
@@ -747,54 +1023,62 @@ class ExasolLineageExtractor:
 
                     # Validate the reference exists
                     if table_id not in self.objects:
-                        ref_name_upper = ref.name.upper()
-                        for obj_id in self.objects:
-                            if obj_id.endswith(f".{ref_name_upper}"):
-                                table_id = obj_id
-                                break
-                        else:
+                        table_id = self._find_by_name(ref.name.upper())
+                        if not table_id:
                             continue
 
                     # Skip self-references
                     if table_id == view_id:
                         continue
 
-                    # Check if this dependency already exists
-                    existing = any(
-                        d["source_id"] == table_id and d["target_id"] == view_id
-                        for d in self.table_deps
-                    )
-
-                    if not existing:
-                        self.table_deps.append({
-                            "source_id": table_id,
-                            "target_id": view_id,
-                            "dependency_type": "VIEW",
-                            "reference_type": ref.reference_type,
-                        })
+                    # Skips references already recorded for this view
+                    if self._add_dependency(table_id, view_id, "VIEW", ref.reference_type):
                         dep_count += 1
 
         print(f"  Found {dep_count} additional dependencies from view definitions")
 
+    def _parse_views_in_parallel(self, views: List[dict]) -> Dict[bytes, list]:
+        """
+        Parse the distinct view definitions across CPU cores, keyed by _definition_key.
+
+        Parsing is CPU-bound and views are independent, so large batches are fanned
+        out to a process pool. Returns an empty dict for small batches (or with
+        script_parsing.max_workers: 1) so the caller parses them in-process.
+        """
+        pending: Dict[bytes, str] = {}
+        for view in views:
+            pending.setdefault(_definition_key(view["definition"]), view["definition"])
+
+        max_workers = self.config.get("script_parsing", {}).get("max_workers")
+        if len(pending) < PARALLEL_PARSE_THRESHOLD or max_workers == 1:
+            return {}
+
+        print(f"  Parsing {len(pending)} distinct view definitions in parallel...")
+        with ProcessPoolExecutor(
+            max_workers=max_workers,
+            initializer=_init_parse_worker,
+            initargs=(dict.fromkeys(self.objects),),
+        ) as executor:
+            return dict(zip(pending, executor.map(_parse_view_job, pending.values(), chunksize=32)))
+
+    def _add_dependency(self, source_id: str, target_id: str, dependency_type: str, reference_type: str) -> bool:
+        """
+        Append a table-level dependency unless one with the same source, target and
+        dependency type exists. Returns whether it was added.
+        """
+        key = (source_id, target_id, dependency_type)
+        if key in self._dep_index:
+            return False
+        self._dep_index.add(key)
+        self.table_deps.append(Dep(source_id, target_id, dependency_type, reference_type))
+        return True
+
     def _extract_dependencies(self) -> None:
         """Extract dependencies from EXA_DBA_DEPENDENCIES system table."""
         print("Extracting dependencies...")
 
-        # Exasol 7.1 compatible - uses REFERENCE_TYPE not DEPENDENCY_TYPE
-        dep_query = """
-        SELECT
-            REFERENCED_OBJECT_SCHEMA,
-            REFERENCED_OBJECT_NAME,
-            REFERENCED_OBJECT_TYPE,
-            OBJECT_SCHEMA,
-            OBJECT_NAME,
-            OBJECT_TYPE,
-            REFERENCE_TYPE
-        FROM EXA_DBA_DEPENDENCIES
-        """
-
         try:
-            result = self.conn.execute(dep_query)
+            result = self._query_rows(self._queries["dependencies"], bulk=True)
             for row in result:
                 ref_schema = row[0]
                 ref_name = row[1]
@@ -808,6 +1092,9 @@ class ExasolLineageExtractor:
                 source_id = f"{ref_schema}.{ref_name}"
                 target_id = f"{obj_schema}.{obj_name}"
 
+                if obj_type == "VIEW" and target_id in self.objects:
+                    self._sys_covered_views.add(target_id)
+
                 # Only add if both objects exist in our extracted data
                 if source_id in self.objects and target_id in self.objects:
                     # Determine dependency type based on object type
@@ -821,17 +1108,39 @@ class ExasolLineageExtractor:
                     # Use REFERENCE_TYPE from Exasol or derive from object type
                     reference_type = ref_type_value if ref_type_value else "SELECT"
 
-                    self.table_deps.append({
-                        "source_id": source_id,
-                        "target_id": target_id,
-                        "dependency_type": dependency_type,
-                        "reference_type": reference_type,
-                    })
+                    self._add_dependency(source_id, target_id, dependency_type, reference_type)
 
             print(f"  Found {len(self.table_deps)} dependencies")
         except Exception as e:
             print(f"  Warning: Could not extract dependencies: {e}")
 
+    def _add_column_dependency(
+        self,
+        source_object_id: str,
+        source_column: str,
+        target_object_id: str,
+        target_column: str,
+        transformation: Optional[str],
+        transformation_type: str,
+    ) -> bool:
+        """
+        Append a column-level dependency unless the same source and target column
+        pair is already recorded. Returns whether it was added.
+        """
+        key = (source_object_id, source_column, target_object_id, target_column)
+        if key in self._column_dep_index:
+            return False
+        self._column_dep_index.add(key)
+        self.column_deps.append({
+            "source_object_id": source_object_id,
+            "source_column": source_column,
+            "target_object_id": target_object_id,
+            "target_column": target_column,
+            "transformation": transformation,
+            "transformation_type": transformation_type,
+        })
+        return True
+
     def _extract_column_lineage(self) -> None:
         """
         Extract column-level lineage by parsing view definitions using sqlglot.
@@ -868,15 +1177,12 @@ class ExasolLineageExtractor:
                 )
 
                 for dep in deps:
-                    self.column_deps.append({
-                        "source_object_id": dep.source_object_id,
-                        "source_column": dep.source_column,
-                        "target_object_id": dep.target_object_id,
-                        "target_column": dep.target_column,
-                        "transformation": dep.transformation,
-                        "transformation_type": dep.transformation_type,
-                    })
-                    column_deps_count += 1
+                    if self._add_column_dependency(
+                        dep.source_object_id, dep.source_column,
+                        dep.target_object_id, dep.target_column,
+                        dep.transformation, dep.transformation_type,
+                    ):
+                        column_deps_count += 1
 
                 views_processed += 1
 
@@ -904,6 +1210,11 @@ class ExasolLineageExtractor:
         views = [o for o in self.objects.values() if o["type"] == "VIEW"]
         column_deps_count = 0
 
+        # Group dependency sources by target once instead of scanning table_deps per view
+        sources_by_target: Dict[str, List[str]] = {}
+        for dep in self.table_deps:
+            sources_by_target.setdefault(dep.target_id, []).append(dep.source_id)
+
         for view in views:
             definition = view.get("definition", "")
             if not definition:
@@ -913,11 +1224,13 @@ class ExasolLineageExtractor:
             view_columns = view.get("columns", [])
 
             # Find source tables from dependencies
-            source_tables = [
-                dep["source_id"]
-                for dep in self.table_deps
-                if dep["target_id"] == view_id
-            ]
+            source_tables = sources_by_target.get(view_id, [])
+            if not source_tables or not view_columns:
+                continue
+
+            # Identifiers in the definition, to test column references by lookup
+            definition_upper = definition.upper()
+            definition_tokens = set(_IDENTIFIER.findall(definition_upper))
 
             # Simple column mapping - match by name
             for source_id in source_tables:
@@ -925,24 +1238,32 @@ class ExasolLineageExtractor:
                 if not source_obj or "columns" not in source_obj:
                     continue
 
+                # A source column maps to every view column if the definition references
+                # it, otherwise only to a view column of the same name. Names that are not
+                # plain identifiers fall back to a substring test.
                 source_columns = source_obj["columns"]
+                referenced: List[int] = []  # positions in source_columns
+                unreferenced_by_name: Dict[str, List[int]] = {}
+                for position, source_col in enumerate(source_columns):
+                    source_col_name = source_col["name"].upper()
+                    if _IDENTIFIER.fullmatch(source_col_name):
+                        is_referenced = source_col_name in definition_tokens
+                    else:
+                        is_referenced = source_col_name in definition_upper
+                    if is_referenced:
+                        referenced.append(position)
+                    else:
+                        unreferenced_by_name.setdefault(source_col_name, []).append(position)
 
                 for view_col in view_columns:
-                    view_col_name = view_col["name"].upper()
-
-                    for source_col in source_columns:
-                        source_col_name = source_col["name"].upper()
-
-                        # Check if column names match or are referenced in definition
-                        if view_col_name == source_col_name or source_col_name in definition.upper():
-                            self.column_deps.append({
-                                "source_object_id": source_id,
-                                "source_column": source_col["name"],
-                                "target_object_id": view_id,
-                                "target_column": view_col["name"],
-                                "transformation": None,
-                                "transformation_type": "UNKNOWN",
-                            })
+                    same_name = unreferenced_by_name.get(view_col["name"].upper())
+                    # Keep source column order
+                    matches = sorted(referenced + same_name) if same_name else referenced
+
+                    for position in matches:
+                        if self._add_column_dependency(
+                            source_id, source_columns[position]["name"], view_id, view_col["name"], None, "UNKNOWN"
+                        ):
                             column_deps_count += 1
 
         print(f"  Found {column_deps_count} column-level dependencies (fallback method)")
@@ -953,42 +1274,31 @@ class ExasolLineageExtractor:
         return self.object_counter
 
     def _build_cache(self) -> dict:
-        """Build the final cache structure."""
+        """
+        Build the final cache structure.
+
+        Table-level dependencies stay Dep records; write_json_stream serializes them
+        as JSON objects. Index lists are sorted so consumers can bisect them.
+        """
         # Build indexes
-        by_schema: Dict[str, List[str]] = {}
-        by_type: Dict[str, List[str]] = {}
-        forward_edges: Dict[str, List[str]] = {}
-        backward_edges: Dict[str, List[str]] = {}
+        by_schema: Dict[str, List[str]] = defaultdict(list)
+        by_type: Dict[str, List[str]] = defaultdict(list)
+        forward_edges: Dict[str, Set[str]] = defaultdict(set)
+        backward_edges: Dict[str, Set[str]] = defaultdict(set)
 
         for obj_id, obj in self.objects.items():
-            schema = obj["schema"]
-            obj_type = obj["type"]
-
-            if schema not in by_schema:
-                by_schema[schema] = []
-            by_schema[schema].append(obj_id)
-
-            if obj_type not in by_type:
-                by_type[obj_type] = []
-            by_type[obj_type].append(obj_id)
+            by_schema[obj["schema"]].append(obj_id)
+            by_type[obj["type"]].append(obj_id)
 
         for dep in self.table_deps:
-            src, tgt = dep["source_id"], dep["target_id"]
-
-            if src not in forward_edges:
-                forward_edges[src] = []
-            if tgt not in forward_edges[src]:
-                forward_edges[src].append(tgt)
-
-            if tgt not in backward_edges:
-                backward_edges[tgt] = []
-            if src not in backward_edges[tgt]:
-                backward_edges[tgt].append(src)
+            src, tgt = dep.source_id, dep.target_id
+            forward_edges[src].add(tgt)
+            backward_edges[tgt].add(src)
 
         return {
             "metadata": {
                 "version": "1.0.0",
-                "generated_at": datetime.now().isoformat(),
+                "generated_at": self._now.isoformat(),
                 "source_database": self.config["connection"]["host"],
                 "object_count": len(self.objects),
                 "column_count": sum(
@@ -1002,10 +1312,10 @@ class ExasolLineageExtractor:
                 "column_level": self.column_deps,
             },
             "indexes": {
-                "by_schema": by_schema,
-                "by_type": by_type,
-                "forward_edges": forward_edges,
-                "backward_edges": backward_edges,
+                "by_schema": {schema: sorted(ids) for schema, ids in by_schema.items()},
+                "by_type": {obj_type: sorted(ids) for obj_type, ids in by_type.items()},
+                "forward_edges": {src: sorted(tgts) for src, tgts in forward_edges.items()},
+                "backward_edges": {tgt: sorted(srcs) for tgt, srcs in backward_edges.items()},
             },
         }
 
@@ -1072,8 +1382,7 @@ def main():
 
     # Write cache
     pretty = config.get("output", {}).get("pretty_print", True)
-    with open(output_path, "w") as f:
-        json.dump(cache, f, indent=2 if pretty else None)
+    write_json_stream(cache, output_path, pretty)
 
     print(f"\nCache written to {output_path}")
     print(f"File size: {output_path.stat().st_size / 1024 / 1024:.2f} MB")
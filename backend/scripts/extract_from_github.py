@@ -15,25 +15,57 @@ Environment:
 
 import argparse
 import base64
-import json
 import logging
 import os
 import re
 import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime
+from itertools import chain, count
 from pathlib import Path
 from typing import Optional
 from dataclasses import dataclass, field
+from urllib.parse import parse_qs, urlparse
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 # Add parent to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
+from scripts.common import PARALLEL_PARSE_THRESHOLD, read_json, write_json
 from scripts.script_parser import SQLParser
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# How often a request is re-sent after GitHub rate limits it
+RATE_LIMIT_RETRIES = 5
+
+# CREATE OR REPLACE VIEW/TABLE project.dataset.name (project optional), compiled once
+_CREATE_PATTERN = re.compile(
+    r"CREATE\s+(?:OR\s+REPLACE\s+)?(?:MATERIALIZED\s+)?(VIEW|TABLE|PROCEDURE|FUNCTION)\s+"
+    r"(?:`?([a-zA-Z0-9_-]+)`?\.)?`?([a-zA-Z0-9_-]+)`?\.`?([a-zA-Z0-9_-]+)`?",
+    re.IGNORECASE,
+)
+
+# SQLParser of a parse worker process, created once by _init_parse_worker
+_worker_sql_parser: Optional[SQLParser] = None
+
+
+def _init_parse_worker() -> None:
+    """Process pool initializer: build the worker's SQLParser once."""
+    global _worker_sql_parser
+    _worker_sql_parser = SQLParser(dialect="bigquery", require_schema=True)
+
+
+def _parse_sql_job(job: tuple) -> tuple:
+    """Process pool task: analyze one (file_path, content) pair into (target_info, source_tables)."""
+    file_path, content = job
+    return GitHubLineageExtractor.analyze_sql(_worker_sql_parser, file_path, content)
+
 
 @dataclass
 class GitHubConfig:
@@ -45,6 +77,10 @@ class GitHubConfig:
     branch: str = "main"  # or "master"
     verify_ssl: bool = True
     repos: list = None  # If set, only scan these repos
+    max_workers: int = 16  # Concurrent API requests
+    blob_cache_dir: Optional[str] = None  # If set, file contents are kept here by blob SHA between runs
+    store_sql_preview: bool = False  # Keep (and output) the first 1000 chars of each defining file
+    parse_workers: Optional[int] = None  # SQL parsing processes (None: one per CPU, 1: parse inline)
 
     @property
     def headers(self) -> dict:
@@ -54,7 +90,7 @@ class GitHubConfig:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class ExtractedObject:
     """Represents an extracted database object."""
     object_id: str
@@ -66,7 +102,7 @@ class ExtractedObject:
     sql_text: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class ExtractedDependency:
     """Represents a dependency between objects."""
     source_id: str
@@ -79,9 +115,38 @@ class GitHubLineageExtractor:
 
     def __init__(self, config: GitHubConfig):
         self.config = config
+        # One pooled session for all requests, sized so every worker keeps its connection.
+        # Transient server errors and 429s are retried with backoff (honouring Retry-After).
+        self.session = requests.Session()
+        self.session.headers.update(config.headers)
+        retry = Retry(
+            total=5,
+            backoff_factor=1.0,
+            status_forcelist=(429, 502, 503, 504),
+            allowed_methods=frozenset(["GET"]),
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=config.max_workers, max_retries=retry)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        if config.blob_cache_dir:
+            Path(config.blob_cache_dir).mkdir(parents=True, exist_ok=True)
+        # API calls are latency bound, so they are issued from a thread pool; parsing
+        # is CPU bound and goes to a process pool (started on first use), while all
+        # bookkeeping stays on the calling thread
+        self.executor = ThreadPoolExecutor(max_workers=config.max_workers)
+        self._parse_pool: Optional[ProcessPoolExecutor] = None
         self.sql_parser = SQLParser(dialect="bigquery", require_schema=True)
         self.objects: dict[str, ExtractedObject] = {}
         self.dependencies: list[ExtractedDependency] = []
+        # Run timestamp recorded as extracted_at
+        self._now = datetime.now()
+        # (source_id, target_id, dependency_type) of every entry in dependencies
+        self._dependency_keys: set[tuple[str, str, str]] = set()
+        # Numeric IDs (required by the Pydantic models), assigned once per string ID
+        self._numeric_ids: dict[str, int] = {}
+        self._numeric_id_counter = count(1)
         self.stats = {
             "repos_scanned": 0,
             "repos_with_bigquery": 0,
@@ -91,17 +156,54 @@ class GitHubLineageExtractor:
             "errors": 0
         }
 
+    def _get(self, url: str, params: Optional[dict] = None) -> requests.Response:
+        """
+        GET an API URL on the shared session.
+
+        GitHub answers rate-limited requests with 403: for the primary limit
+        (X-RateLimit-Remaining: 0) this waits until X-RateLimit-Reset, for secondary
+        limits it waits Retry-After seconds, then tries again.
+        """
+        for _ in range(RATE_LIMIT_RETRIES):
+            response = self.session.get(url, params=params, verify=self.config.verify_ssl)
+            if response.status_code != 403:
+                return response
+
+            if response.headers.get("Retry-After"):
+                wait = int(response.headers["Retry-After"])
+            elif response.headers.get("X-RateLimit-Remaining") == "0":
+                wait = int(response.headers.get("X-RateLimit-Reset", 0)) - int(time.time())
+            else:
+                return response  # A real permission error
+
+            wait = max(wait, 1)
+            logger.warning(f"GitHub rate limit hit, retrying in {wait}s...")
+            time.sleep(wait)
+        return response
+
     def list_org_repos(self) -> list[dict]:
-        """List all repos in the organization."""
-        repos = []
-        page = 1
+        """
+        List all repos in the organization.
+
+        When the first page's Link header names the last page, the remaining pages
+        are fetched concurrently; otherwise pages are read until an empty one.
+        """
+        url = f"{self.config.api_url}/orgs/{self.config.org}/repos"
         per_page = 100
 
-        while True:
-            url = f"{self.config.api_url}/orgs/{self.config.org}/repos"
-            params = {"page": page, "per_page": per_page, "type": "all"}
+        def fetch_page(page: int) -> requests.Response:
+            return self._get(url, {"page": page, "per_page": per_page, "type": "all"})
 
-            response = requests.get(url, headers=self.config.headers, params=params, verify=self.config.verify_ssl)
+        repos = []
+        first = fetch_page(1)
+        last = first.links.get("last")
+        if first.status_code == 200 and last:
+            last_page = int(parse_qs(urlparse(last["url"]).query)["page"][0])
+            responses = chain([first], self.executor.map(fetch_page, range(2, last_page + 1)))
+        else:
+            responses = chain([first], map(fetch_page, count(2)))
+
+        for response in responses:
             if response.status_code != 200:
                 logger.error(f"Failed to list repos: {response.status_code} - {response.text}")
                 break
@@ -112,28 +214,45 @@ class GitHubLineageExtractor:
 
             repos.extend(batch)
             logger.info(f"Fetched {len(repos)} repos so far...")
-            page += 1
 
         logger.info(f"Total repos found: {len(repos)}")
         return repos
 
-    def check_bigquery_folder(self, repo_name: str) -> bool:
-        """Check if repo has bigquery/ folder."""
-        url = f"{self.config.api_url}/repos/{self.config.org}/{repo_name}/contents/{self.config.bigquery_folder}"
-        params = {"ref": self.config.branch}
-
-        response = requests.get(url, headers=self.config.headers, params=params, verify=self.config.verify_ssl)
-        return response.status_code == 200
-
     def get_sql_files(self, repo_name: str, path: str = "") -> list[dict]:
-        """Recursively get all .sql files from a path."""
+        """
+        Get all .sql files under a path (default: the bigquery folder).
+
+        Lists the whole branch with a single recursive git/trees request (the
+        endpoint accepts a branch name as well as a SHA) instead of a contents
+        request per directory. Falls back to walking the contents API if the
+        tree cannot be fetched or the listing is truncated.
+        """
         if not path:
             path = self.config.bigquery_folder
+        url = f"{self.config.api_url}/repos/{self.config.org}/{repo_name}/git/trees/{self.config.branch}"
+
+        response = self._get(url, {"recursive": 1})
+        tree = response.json() if response.status_code == 200 else {}
+        if tree and not tree.get("truncated"):
+            prefix = path.rstrip("/") + "/"
+            return [
+                {"path": entry["path"], "name": entry["path"].rsplit("/", 1)[-1], "sha": entry["sha"]}
+                for entry in tree["tree"]
+                if entry["type"] == "blob"
+                and entry["path"].startswith(prefix)
+                and entry["path"].endswith(".sql")
+            ]
+
+        logger.debug(f"Tree listing unavailable for {repo_name}, walking contents instead")
+        return self._get_sql_files_from_contents(repo_name, path)
+
+    def _get_sql_files_from_contents(self, repo_name: str, path: str) -> list[dict]:
+        """Recursively get all .sql files from a path, one contents request per directory."""
 
         url = f"{self.config.api_url}/repos/{self.config.org}/{repo_name}/contents/{path}"
         params = {"ref": self.config.branch}
 
-        response = requests.get(url, headers=self.config.headers, params=params, verify=self.config.verify_ssl)
+        response = self._get(url, params)
         if response.status_code != 200:
             return []
 
@@ -148,7 +267,7 @@ class GitHubLineageExtractor:
                 sql_files.append(item)
             elif item["type"] == "dir":
                 # Recursively get SQL files from subdirectories
-                sql_files.extend(self.get_sql_files(repo_name, item["path"]))
+                sql_files.extend(self._get_sql_files_from_contents(repo_name, item["path"]))
 
         return sql_files
 
@@ -157,7 +276,7 @@ class GitHubLineageExtractor:
         url = f"{self.config.api_url}/repos/{self.config.org}/{repo_name}/contents/{file_path}"
         params = {"ref": self.config.branch}
 
-        response = requests.get(url, headers=self.config.headers, params=params, verify=self.config.verify_ssl)
+        response = self._get(url, params)
         if response.status_code != 200:
             return None
 
@@ -166,42 +285,101 @@ class GitHubLineageExtractor:
             return base64.b64decode(data["content"]).decode("utf-8")
         return data.get("content")
 
-    def extract_target_from_sql(self, sql: str) -> Optional[tuple[str, str, str]]:
+    def get_blob_content(self, repo_name: str, sha: str) -> Optional[str]:
         """
-        Extract target object from CREATE statement.
-        Returns (project_dataset_table, object_type, name) or None.
+        Get the content of a file by its blob SHA (no path lookup or metadata).
+
+        A blob's content never changes, so with blob_cache_dir set, files seen in
+        an earlier run are read from disk instead of being downloaded again.
         """
-        # Patterns for CREATE statements
-        patterns = [
-            # CREATE OR REPLACE VIEW/TABLE project.dataset.name
-            r"CREATE\s+(?:OR\s+REPLACE\s+)?(?:MATERIALIZED\s+)?(VIEW|TABLE|PROCEDURE|FUNCTION)\s+(?:`?([a-zA-Z0-9_-]+)`?\.)?`?([a-zA-Z0-9_-]+)`?\.`?([a-zA-Z0-9_-]+)`?",
-        ]
+        cache_path = Path(self.config.blob_cache_dir) / f"{sha}.sql" if self.config.blob_cache_dir else None
+        if cache_path and cache_path.exists():
+            return cache_path.read_text(encoding="utf-8")
 
-        sql_upper = sql.upper()
+        url = f"{self.config.api_url}/repos/{self.config.org}/{repo_name}/git/blobs/{sha}"
 
-        for pattern in patterns:
-            match = re.search(pattern, sql, re.IGNORECASE | re.MULTILINE)
-            if match:
-                obj_type = match.group(1).upper()
-                project = match.group(2) or ""
-                dataset = match.group(3)
-                name = match.group(4)
+        response = self._get(url)
+        if response.status_code != 200:
+            return None
 
-                # Build full qualified name
-                if project:
-                    full_name = f"{project}.{dataset}.{name}"
-                else:
-                    full_name = f"{dataset}.{name}"
+        data = response.json()
+        if data.get("encoding") == "base64":
+            content = base64.b64decode(data["content"]).decode("utf-8")
+        else:
+            content = data.get("content")
+
+        if cache_path and content is not None:
+            # Write then rename, so an interrupted run never leaves a partial entry.
+            # The temp name is unique per write: fetch threads may download the same
+            # blob at once (files with identical content share a SHA)
+            with tempfile.NamedTemporaryFile(
+                "w", encoding="utf-8", dir=cache_path.parent, suffix=".tmp", delete=False
+            ) as tmp:
+                tmp.write(content)
+            Path(tmp.name).replace(cache_path)
+        return content
+
+    def fetch_sql_file(self, repo_name: str, file_info: dict) -> Optional[str]:
+        """Get a listed SQL file's content, by blob SHA when the listing has one."""
+        if file_info.get("sha"):
+            return self.get_blob_content(repo_name, file_info["sha"])
+        return self.get_file_content(repo_name, file_info["path"])
+
+    @staticmethod
+    def extract_target_from_sql(sql: str) -> Optional[tuple[str, str, str]]:
+        """
+        Extract target object from CREATE statement.
+        Returns (project_dataset_table, object_type, name) or None.
+        """
+        match = _CREATE_PATTERN.search(sql)
+        if not match:
+            return None
+
+        obj_type = match.group(1).upper()
+        project = match.group(2) or ""
+        dataset = match.group(3)
+        name = match.group(4)
 
-                return (full_name, obj_type, name)
+        # Build full qualified name
+        if project:
+            full_name = f"{project}.{dataset}.{name}"
+        else:
+            full_name = f"{dataset}.{name}"
 
-        return None
+        return (full_name, obj_type, name)
 
     def parse_sql_file(self, repo_name: str, file_info: dict) -> None:
         """Parse a SQL file and extract lineage."""
-        file_path = file_info["path"]
+        self.parse_sql_content(repo_name, file_info["path"], self.fetch_sql_file(repo_name, file_info))
+
+    @staticmethod
+    def analyze_sql(sql_parser: SQLParser, file_path: str, content: str) -> tuple:
+        """
+        Find the object a SQL file creates and the tables it reads.
+        Returns (target_info, source_tables); target_info is None without a CREATE statement.
+        """
+        # Extract target from CREATE statement
+        target_info = GitHubLineageExtractor.extract_target_from_sql(content)
+        if not target_info:
+            return None, []
+
+        # Parse for source tables
+        try:
+            table_refs = sql_parser.parse(content)
+            source_tables = [{"name": ref.name, "schema": ref.schema} for ref in table_refs]
+        except Exception as e:
+            logger.warning(f"Failed to parse SQL in {file_path}: {e}")
+            source_tables = []
+        return target_info, source_tables
 
-        content = self.get_file_content(repo_name, file_path)
+    def parse_sql_content(
+        self, repo_name: str, file_path: str, content: Optional[str], analysis: Optional[tuple] = None
+    ) -> None:
+        """
+        Extract lineage from the fetched content of a SQL file (None if the fetch failed).
+
+        analysis is the file's analyze_sql result when it was already computed elsewhere.
+        """
         if not content:
             logger.warning(f"Could not fetch content for {repo_name}/{file_path}")
             self.stats["errors"] += 1
@@ -209,22 +387,15 @@ class GitHubLineageExtractor:
 
         self.stats["sql_files_parsed"] += 1
 
-        # Extract target from CREATE statement
-        target_info = self.extract_target_from_sql(content)
+        if analysis is None:
+            analysis = self.analyze_sql(self.sql_parser, file_path, content)
+        target_info, source_tables = analysis
         if not target_info:
             logger.debug(f"No CREATE statement found in {file_path}")
             return
 
         target_full_name, obj_type, target_name = target_info
 
-        # Parse for source tables
-        try:
-            table_refs = self.sql_parser.parse(content)
-            source_tables = [{"name": ref.name, "schema": ref.schema} for ref in table_refs]
-        except Exception as e:
-            logger.warning(f"Failed to parse SQL in {file_path}: {e}")
-            source_tables = []
-
         # Determine schema from target
         parts = target_full_name.split(".")
         if len(parts) >= 2:
@@ -243,7 +414,7 @@ class GitHubLineageExtractor:
                 object_type=obj_type,
                 source_repo=repo_name,
                 source_file=file_path,
-                sql_text=content[:1000]  # Store first 1000 chars
+                sql_text=content[:1000] if self.config.store_sql_preview else ""  # First 1000 chars, if requested
             )
             self.stats["objects_found"] += 1
 
@@ -271,7 +442,11 @@ class GitHubLineageExtractor:
                 )
                 self.stats["objects_found"] += 1
 
-            # Create dependency
+            # Create dependency, once per source/target pair
+            key = (source_id, target_id, "DATA")
+            if key in self._dependency_keys:
+                continue
+            self._dependency_keys.add(key)
             dep = ExtractedDependency(
                 source_id=source_id,
                 target_id=target_id,
@@ -285,51 +460,81 @@ class GitHubLineageExtractor:
         repo_name = repo["name"]
         self.stats["repos_scanned"] += 1
 
-        # Check if repo has bigquery folder
-        if not self.check_bigquery_folder(repo_name):
-            logger.debug(f"Skipping {repo_name} - no bigquery/ folder")
+        # Get all SQL files; a repo without a bigquery folder simply has none
+        sql_files = self.get_sql_files(repo_name)
+        if not sql_files:
+            logger.debug(f"Skipping {repo_name} - no bigquery/ folder or no .sql files in it")
             return
 
         logger.info(f"Processing {repo_name}...")
         self.stats["repos_with_bigquery"] += 1
-
-        # Get all SQL files
-        sql_files = self.get_sql_files(repo_name)
         logger.info(f"  Found {len(sql_files)} SQL files")
 
-        # Parse each SQL file
-        for file_info in sql_files:
-            self.parse_sql_file(repo_name, file_info)
+        # Fetch the files concurrently; results are recorded here in file order
+        fetched = zip(sql_files, self.executor.map(lambda file_info: self.fetch_sql_file(repo_name, file_info), sql_files))
+        if len(sql_files) < PARALLEL_PARSE_THRESHOLD or self.config.parse_workers == 1:
+            for file_info, content in fetched:
+                self.parse_sql_content(repo_name, file_info["path"], content)
+            return
+
+        # Hand each file to the parse processes as soon as it is downloaded
+        pool = self._get_parse_pool()
+        jobs = [
+            (file_info, content, pool.submit(_parse_sql_job, (file_info["path"], content)) if content else None)
+            for file_info, content in fetched
+        ]
+        for file_info, content, future in jobs:
+            self.parse_sql_content(repo_name, file_info["path"], content, future.result() if future else None)
+
+    def _get_parse_pool(self) -> ProcessPoolExecutor:
+        """The SQL parsing process pool, started on first use."""
+        if self._parse_pool is None:
+            self._parse_pool = ProcessPoolExecutor(
+                max_workers=self.config.parse_workers, initializer=_init_parse_worker
+            )
+        return self._parse_pool
 
     def run(self) -> dict:
         """Run the extraction process."""
         logger.info(f"Starting extraction from {self.config.org}...")
 
-        # Use specified repos or list all repos
-        if self.config.repos:
-            logger.info(f"Scanning specified repos: {self.config.repos}")
-            repos = [{"name": name} for name in self.config.repos]
-        else:
-            repos = self.list_org_repos()
-
-        # Process each repo
-        for repo in repos:
-            try:
-                self.process_repo(repo)
-            except Exception as e:
-                logger.error(f"Error processing {repo['name']}: {e}")
-                self.stats["errors"] += 1
+        try:
+            # Use specified repos or list all repos
+            if self.config.repos:
+                logger.info(f"Scanning specified repos: {self.config.repos}")
+                repos = [{"name": name} for name in self.config.repos]
+            else:
+                repos = self.list_org_repos()
+
+            # Process each repo
+            for repo in repos:
+                try:
+                    self.process_repo(repo)
+                except Exception as e:
+                    logger.error(f"Error processing {repo['name']}: {e}")
+                    self.stats["errors"] += 1
+        finally:
+            self.executor.shutdown()
+            if self._parse_pool is not None:
+                self._parse_pool.shutdown()
 
         logger.info(f"Extraction complete. Stats: {self.stats}")
         return self.build_cache()
 
+    def _numeric_id(self, object_id: str) -> int:
+        """Unique, stable numeric ID for a string object ID."""
+        numeric_id = self._numeric_ids.get(object_id)
+        if numeric_id is None:
+            numeric_id = self._numeric_ids[object_id] = next(self._numeric_id_counter)
+        return numeric_id
+
     def build_cache(self) -> dict:
         """Build the lineage cache structure."""
         objects_list = []
         for obj in self.objects.values():
-            objects_list.append({
+            entry = {
                 "id": obj.object_id,  # String ID like "SCHEMA.TABLE"
-                "object_id": hash(obj.object_id) % 10000000,  # Numeric ID for Pydantic
+                "object_id": self._numeric_id(obj.object_id),  # Numeric ID for Pydantic
                 "name": obj.name,
                 "schema": obj.schema_name,
                 "type": obj.object_type,
@@ -338,7 +543,10 @@ class GitHubLineageExtractor:
                 "database": "BIGQUERY",
                 "source_repo": obj.source_repo,
                 "source_file": obj.source_file
-            })
+            }
+            if self.config.store_sql_preview:
+                entry["sql_text"] = obj.sql_text
+            objects_list.append(entry)
 
         deps_list = []
         for dep in self.dependencies:
@@ -354,7 +562,7 @@ class GitHubLineageExtractor:
             "metadata": {
                 "source": "github",
                 "organization": self.config.org,
-                "extracted_at": datetime.now().isoformat(),
+                "extracted_at": self._now.isoformat(),
                 "stats": self.stats
             },
             "objects": objects_list,
@@ -362,8 +570,12 @@ class GitHubLineageExtractor:
         }
 
 
-def merge_caches(base: dict, new: dict) -> dict:
-    """Merge two lineage caches."""
+def merge_caches(base: dict, new: dict, merged_at: str = None) -> dict:
+    """
+    Merge two lineage caches.
+
+    merged_at is the ISO timestamp recorded in the metadata (defaults to now).
+    """
     # Merge objects (avoid duplicates by id)
     existing_ids = {obj.get("id") or obj.get("object_id") for obj in base.get("objects", [])}
     for obj in new.get("objects", []):
@@ -386,7 +598,7 @@ def merge_caches(base: dict, new: dict) -> dict:
             existing_deps.add(key)
 
     # Update metadata
-    base["metadata"]["merged_at"] = datetime.now().isoformat()
+    base["metadata"]["merged_at"] = merged_at or datetime.now().isoformat()
     base["metadata"]["github_stats"] = new["metadata"].get("stats", {})
 
     return base
@@ -403,6 +615,10 @@ def main():
     parser.add_argument("--branch", default="main", help="Branch to scan (default: main)")
     parser.add_argument("--no-verify-ssl", action="store_true", help="Disable SSL verification")
     parser.add_argument("--repos", help="Comma-separated list of repo names to scan (default: scan all)")
+    parser.add_argument("--max-workers", type=int, default=16, help="Concurrent GitHub API requests (default: 16)")
+    parser.add_argument("--store-sql-preview", action="store_true", help="Include the first 1000 chars of each defining SQL file in the output")
+    parser.add_argument("--blob-cache-dir", help="Keep file contents here between runs; unchanged files are not re-downloaded")
+    parser.add_argument("--parse-workers", type=int, help="Processes for SQL parsing (default: one per CPU; 1 parses inline)")
     parser.add_argument("--verbose", "-v", action="store_true", help="Verbose logging")
 
     args = parser.parse_args()
@@ -430,7 +646,11 @@ def main():
         bigquery_folder=args.bigquery_folder,
         branch=args.branch,
         verify_ssl=not args.no_verify_ssl,
-        repos=repos_list
+        repos=repos_list,
+        max_workers=args.max_workers,
+        blob_cache_dir=args.blob_cache_dir,
+        store_sql_preview=args.store_sql_preview,
+        parse_workers=args.parse_workers
     )
 
     # Run extraction
@@ -440,17 +660,15 @@ def main():
     # Merge if requested
     if args.merge_with:
         if Path(args.merge_with).exists():
-            with open(args.merge_with) as f:
-                base_cache = json.load(f)
-            cache = merge_caches(base_cache, cache)
+            base_cache = read_json(args.merge_with)
+            cache = merge_caches(base_cache, cache, merged_at=cache["metadata"]["extracted_at"])
             logger.info(f"Merged with {args.merge_with}")
         else:
             logger.warning(f"Merge file not found: {args.merge_with}")
 
     # Save output
     output_path = Path(args.output)
-    with open(output_path, "w") as f:
-        json.dump(cache, f, indent=2)
+    write_json(cache, output_path)
 
     logger.info(f"Saved to {output_path}")
     logger.info(f"Objects: {len(cache['objects'])}, Dependencies: {len(cache['dependencies'])}")
@@ -3,12 +3,16 @@
 Generate realistic sample Exasol lineage data.
 Creates deep dependency chains with cross-schema references.
 """
-import json
 import random
+from collections import defaultdict
+from dataclasses import dataclass
 from datetime import datetime, timedelta
-from typing import Dict, List, Set
+from itertools import accumulate, count
+from typing import Dict, List, Optional
 from pathlib import Path
 
+from common import write_json_stream
+
 
 # Configuration
 NUM_SCHEMAS = 15
@@ -45,14 +49,120 @@ DATA_TYPES = {
     "text": "VARCHAR(2000)"
 }
 
+# Column-level transformations by type
+TRANSFORMATION_CONFIGS = [
+    # (transformation_type, sql_pattern, weight)
+    ("DIRECT", None, 40),  # Direct mapping - most common
+    ("AGGREGATE", "SUM({col})", 10),
+    ("AGGREGATE", "COUNT({col})", 8),
+    ("AGGREGATE", "AVG({col})", 5),
+    ("AGGREGATE", "MAX({col})", 4),
+    ("AGGREGATE", "MIN({col})", 3),
+    ("CAST", "CAST({col} AS VARCHAR)", 8),
+    ("CAST", "CAST({col} AS DATE)", 5),
+    ("CAST", "CAST({col} AS DECIMAL(15,2))", 3),
+    ("FUNCTION", "COALESCE({col}, 0)", 6),
+    ("FUNCTION", "NVL({col}, '')", 4),
+    ("FUNCTION", "UPPER({col})", 5),
+    ("FUNCTION", "TRIM({col})", 4),
+    ("FUNCTION", "CONCAT(prefix_, {col})", 2),
+    ("EXPRESSION", "{col} * 100", 5),
+    ("EXPRESSION", "{col} + 1", 3),
+    ("EXPRESSION", "{col} || ' ' || other_col", 2),
+    ("CASE", "CASE WHEN {col} > 0 THEN 'POSITIVE' ELSE 'NEGATIVE' END", 4),
+    ("CASE", "CASE WHEN {col} IS NULL THEN 'N/A' ELSE {col} END", 3),
+]
+
+# Each (transformation_type, sql_pattern) repeated weight times, for weighted random selection
+WEIGHTED_TRANSFORMS = [
+    (trans_type, sql_pattern)
+    for trans_type, sql_pattern, weight in TRANSFORMATION_CONFIGS
+    for _ in range(weight)
+]
+
+# Every base column name as (name, data_type, column type), flattened once
+FLAT_COLUMNS = tuple(
+    (name, DATA_TYPES[col_type], col_type) for col_type, names in COLUMN_TYPES.items() for name in names
+)
+# Cumulative weights that keep each column type equally likely, however many names it has
+FLAT_COLUMN_CUM_WEIGHTS = tuple(accumulate(1 / len(COLUMN_TYPES[col_type]) for _, _, col_type in FLAT_COLUMNS))
+
+
+@dataclass(slots=True)
+class SampleObject:
+    """A generated object. Fields its type doesn't have stay None and are left out of the cache."""
+    id: str
+    schema: str
+    name: str
+    type: str
+    owner: str
+    object_id: int
+    created_at: str
+    description: str
+    modified_at: Optional[str] = None
+    columns: Optional[List[dict]] = None
+    row_count: Optional[int] = None
+    size_bytes: Optional[int] = None
+    definition: Optional[str] = None
+    connection_string: Optional[str] = None
+    user: Optional[str] = None
+    adapter_name: Optional[str] = None
+    connection_name: Optional[str] = None
+    remote_schema: Optional[str] = None
+    udf_type: Optional[str] = None
+    input_parameters: Optional[List[dict]] = None
+    output_columns: Optional[List[dict]] = None
+    script_language: Optional[str] = None
+    script_text: Optional[str] = None
+
+    def to_dict(self) -> dict:
+        """Cache entry for the object, with only the fields that are set."""
+        return {
+            name: value for name in self.__slots__ if (value := getattr(self, name)) is not None
+        }
+
+
+@dataclass(slots=True)
+class SampleDependency:
+    """A generated table-level dependency; written to the cache as a dict of these fields."""
+    source_id: str
+    target_id: str
+    dependency_type: str
+    reference_type: str
+
+
+@dataclass(slots=True)
+class SampleColumnDependency:
+    """A generated column-level dependency; written to the cache as a dict of these fields."""
+    source_object_id: str
+    source_column: str
+    target_object_id: str
+    target_column: str
+    transformation: Optional[str]
+    transformation_type: str
+
 
 class SampleDataGenerator:
     def __init__(self, seed: int = 42):
-        random.seed(seed)
-        self.objects: Dict[str, dict] = {}
-        self.table_deps: List[dict] = []
-        self.column_deps: List[dict] = []
-        self.object_counter = 100000
+        # Own random stream, so generating doesn't touch (or depend on) the global one
+        self.rng = random.Random(seed)
+        self.objects: Dict[str, SampleObject] = {}
+        self.table_deps: List[SampleDependency] = []
+        self.column_deps: List[SampleColumnDependency] = []
+        self._object_ids = count(100001)
+        # Column dicts by (view, field values...), see _share_column
+        self._column_pool: Dict[tuple, dict] = {}
+        # ISO timestamps for 0..730 days ago, formatted once
+        now = datetime.now()
+        self._date_pool = [(now - timedelta(days=days_ago)).isoformat() for days_ago in range(365 * 2 + 1)]
+        # Object ids of each layer, filled in as the phases create them
+        self.connection_ids: List[str] = []
+        self.virtual_schema_ids: List[str] = []
+        self.raw_tables_by_domain: Dict[str, List[str]] = defaultdict(list)
+        self.staging_tables: List[str] = []
+        self.dwh_tables: List[str] = []
+        self.mart_views: List[str] = []
+        self.tables: List[str] = []
 
     def generate(self) -> dict:
         """Generate complete lineage cache."""
@@ -81,50 +191,52 @@ class SampleDataGenerator:
         for i in range(CONNECTIONS):
             source = sources[i % len(sources)]
             conn_id = f"SYS.CONN_{source}_{i + 1}"
-            self.objects[conn_id] = {
-                "id": conn_id,
-                "schema": "SYS",
-                "name": f"CONN_{source}_{i + 1}",
-                "type": "CONNECTION",
-                "owner": "SYS",
-                "object_id": self._next_id(),
-                "created_at": self._random_date().isoformat(),
-                "description": f"Connection to {source} source system #{i + 1}",
-                "connection_string": f"jdbc:{source.lower()}://server{i + 1}:5432/db",
-                "user": "ETL_USER"
-            }
+            self.objects[conn_id] = SampleObject(
+                id=conn_id,
+                schema="SYS",
+                name=f"CONN_{source}_{i + 1}",
+                type="CONNECTION",
+                owner="SYS",
+                object_id=self._next_id(),
+                created_at=self._random_date(),
+                description=f"Connection to {source} source system #{i + 1}",
+                connection_string=f"jdbc:{source.lower()}://server{i + 1}:5432/db",
+                user="ETL_USER"
+            )
+            self.connection_ids.append(conn_id)
 
     def _generate_virtual_schemas(self):
         """Generate virtual schemas tied to connections."""
-        connections = [k for k in self.objects.keys() if "CONN_" in k]
+        connections = self.connection_ids
         for i in range(VIRTUAL_SCHEMAS):
             conn = connections[i % len(connections)]
             source_name = conn.split("_")[1]
             vs_id = f"EXT.VS_{source_name}_{i + 1}"
-            self.objects[vs_id] = {
-                "id": vs_id,
-                "schema": "EXT",
-                "name": f"VS_{source_name}_{i + 1}",
-                "type": "VIRTUAL_SCHEMA",
-                "owner": "ADMIN_USER",
-                "object_id": self._next_id(),
-                "created_at": self._random_date().isoformat(),
-                "description": f"Virtual schema for {source_name} data",
-                "adapter_name": f"{source_name}_JDBC",
-                "connection_name": conn.split(".")[1],
-                "remote_schema": f"{source_name}_SCHEMA"
-            }
+            self.objects[vs_id] = SampleObject(
+                id=vs_id,
+                schema="EXT",
+                name=f"VS_{source_name}_{i + 1}",
+                type="VIRTUAL_SCHEMA",
+                owner="ADMIN_USER",
+                object_id=self._next_id(),
+                created_at=self._random_date(),
+                description=f"Virtual schema for {source_name} data",
+                adapter_name=f"{source_name}_JDBC",
+                connection_name=conn.split(".")[1],
+                remote_schema=f"{source_name}_SCHEMA"
+            )
+            self.virtual_schema_ids.append(vs_id)
             # Dependency: Virtual schema uses connection
-            self.table_deps.append({
-                "source_id": conn,
-                "target_id": vs_id,
-                "dependency_type": "CONNECTION",
-                "reference_type": "USES"
-            })
+            self.table_deps.append(SampleDependency(
+                source_id=conn,
+                target_id=vs_id,
+                dependency_type="CONNECTION",
+                reference_type="USES"
+            ))
 
     def _generate_raw_tables(self):
         """Generate raw layer tables from virtual schemas."""
-        virtual_schemas = [k for k in self.objects.keys() if k.startswith("EXT.VS_")]
+        virtual_schemas = self.virtual_schema_ids
 
         for domain in DOMAIN_NAMES[:5]:
             schema_name = f"RAW_{domain}"
@@ -132,254 +244,261 @@ class SampleDataGenerator:
                 table_name = f"RAW_{domain}_{i + 1}"
                 table_id = f"{schema_name}.{table_name}"
 
-                columns = self._generate_columns(random.randint(*COLUMNS_PER_TABLE))
-                self.objects[table_id] = {
-                    "id": table_id,
-                    "schema": schema_name,
-                    "name": table_name,
-                    "type": "TABLE",
-                    "owner": "ETL_USER",
-                    "object_id": self._next_id(),
-                    "created_at": self._random_date().isoformat(),
-                    "modified_at": self._random_date().isoformat(),
-                    "description": f"Raw {domain} data table #{i + 1}",
-                    "columns": columns,
-                    "row_count": random.randint(10000, 10000000),
-                    "size_bytes": random.randint(1000000, 5000000000)
-                }
+                columns = self._generate_columns(self.rng.randint(*COLUMNS_PER_TABLE))
+                self.objects[table_id] = SampleObject(
+                    id=table_id,
+                    schema=schema_name,
+                    name=table_name,
+                    type="TABLE",
+                    owner="ETL_USER",
+                    object_id=self._next_id(),
+                    created_at=self._random_date(),
+                    modified_at=self._random_date(),
+                    description=f"Raw {domain} data table #{i + 1}",
+                    columns=columns,
+                    row_count=self.rng.randint(10000, 10000000),
+                    size_bytes=self.rng.randint(1000000, 5000000000)
+                )
+                self.raw_tables_by_domain[domain].append(table_id)
+                self.tables.append(table_id)
 
                 # Some tables depend on virtual schemas
-                if random.random() < 0.4 and virtual_schemas:
-                    vs = random.choice(virtual_schemas)
-                    self.table_deps.append({
-                        "source_id": vs,
-                        "target_id": table_id,
-                        "dependency_type": "ETL",
-                        "reference_type": "INSERT_SELECT"
-                    })
+                if self.rng.random() < 0.4 and virtual_schemas:
+                    vs = self.rng.choice(virtual_schemas)
+                    self.table_deps.append(SampleDependency(
+                        source_id=vs,
+                        target_id=table_id,
+                        dependency_type="ETL",
+                        reference_type="INSERT_SELECT"
+                    ))
 
     def _generate_staging_tables(self):
         """Generate staging layer tables."""
-        raw_tables = [k for k in self.objects.keys() if ".RAW_" in k]
-
         for domain in DOMAIN_NAMES[:5]:
             schema_name = f"STG_{domain}"
             for i in range(15):
                 table_name = f"STG_{domain}_{i + 1}"
                 table_id = f"{schema_name}.{table_name}"
 
-                columns = self._generate_columns(random.randint(*COLUMNS_PER_TABLE))
-                self.objects[table_id] = {
-                    "id": table_id,
-                    "schema": schema_name,
-                    "name": table_name,
-                    "type": "TABLE",
-                    "owner": "ETL_USER",
-                    "object_id": self._next_id(),
-                    "created_at": self._random_date().isoformat(),
-                    "modified_at": self._random_date().isoformat(),
-                    "description": f"Staging {domain} table #{i + 1}",
-                    "columns": columns,
-                    "row_count": random.randint(10000, 5000000),
-                    "size_bytes": random.randint(1000000, 2000000000)
-                }
+                columns = self._generate_columns(self.rng.randint(*COLUMNS_PER_TABLE))
+                self.objects[table_id] = SampleObject(
+                    id=table_id,
+                    schema=schema_name,
+                    name=table_name,
+                    type="TABLE",
+                    owner="ETL_USER",
+                    object_id=self._next_id(),
+                    created_at=self._random_date(),
+                    modified_at=self._random_date(),
+                    description=f"Staging {domain} table #{i + 1}",
+                    columns=columns,
+                    row_count=self.rng.randint(10000, 5000000),
+                    size_bytes=self.rng.randint(1000000, 2000000000)
+                )
+                self.staging_tables.append(table_id)
+                self.tables.append(table_id)
 
                 # Dependencies from raw tables
-                domain_raw = [t for t in raw_tables if domain in t]
+                domain_raw = self.raw_tables_by_domain[domain]
                 if domain_raw:
-                    source_tables = random.sample(domain_raw, min(3, len(domain_raw)))
+                    source_tables = self.rng.sample(domain_raw, min(3, len(domain_raw)))
                     for src in source_tables:
-                        self.table_deps.append({
-                            "source_id": src,
-                            "target_id": table_id,
-                            "dependency_type": "ETL",
-                            "reference_type": "INSERT_SELECT"
-                        })
+                        self.table_deps.append(SampleDependency(
+                            source_id=src,
+                            target_id=table_id,
+                            dependency_type="ETL",
+                            reference_type="INSERT_SELECT"
+                        ))
                         self._add_column_deps(src, table_id)
 
     def _generate_dwh_tables(self):
         """Generate DWH fact and dimension tables."""
-        staging_tables = [k for k in self.objects.keys() if ".STG_" in k]
+        staging_tables = self.staging_tables
 
         # Fact tables
         for i in range(25):
-            domain = random.choice(DOMAIN_NAMES)
+            domain = self.rng.choice(DOMAIN_NAMES)
             table_name = f"FACT_{domain}_{i + 1}"
             table_id = f"DWH.{table_name}"
 
-            columns = self._generate_columns(random.randint(10, 30), include_measures=True)
-            self.objects[table_id] = {
-                "id": table_id,
-                "schema": "DWH",
-                "name": table_name,
-                "type": "TABLE",
-                "owner": "DWH_USER",
-                "object_id": self._next_id(),
-                "created_at": self._random_date().isoformat(),
-                "modified_at": self._random_date().isoformat(),
-                "description": f"Fact table for {domain}",
-                "columns": columns,
-                "row_count": random.randint(1000000, 100000000),
-                "size_bytes": random.randint(1000000000, 50000000000)
-            }
+            columns = self._generate_columns(self.rng.randint(10, 30), include_measures=True)
+            self.objects[table_id] = SampleObject(
+                id=table_id,
+                schema="DWH",
+                name=table_name,
+                type="TABLE",
+                owner="DWH_USER",
+                object_id=self._next_id(),
+                created_at=self._random_date(),
+                modified_at=self._random_date(),
+                description=f"Fact table for {domain}",
+                columns=columns,
+                row_count=self.rng.randint(1000000, 100000000),
+                size_bytes=self.rng.randint(1000000000, 50000000000)
+            )
+            self.dwh_tables.append(table_id)
+            self.tables.append(table_id)
 
             # Dependencies from staging
             if staging_tables:
-                sources = random.sample(staging_tables, min(5, len(staging_tables)))
+                sources = self.rng.sample(staging_tables, min(5, len(staging_tables)))
                 for src in sources:
-                    self.table_deps.append({
-                        "source_id": src,
-                        "target_id": table_id,
-                        "dependency_type": "ETL",
-                        "reference_type": "INSERT_SELECT"
-                    })
+                    self.table_deps.append(SampleDependency(
+                        source_id=src,
+                        target_id=table_id,
+                        dependency_type="ETL",
+                        reference_type="INSERT_SELECT"
+                    ))
                     self._add_column_deps(src, table_id)
 
         # Dimension tables
         dimensions = ["CUSTOMER", "PRODUCT", "TIME", "GEOGRAPHY", "CHANNEL", "PROMOTION", "EMPLOYEE", "SUPPLIER"]
         for dim in dimensions:
             table_id = f"DWH.DIM_{dim}"
-            columns = self._generate_columns(random.randint(8, 20))
-
-            self.objects[table_id] = {
-                "id": table_id,
-                "schema": "DWH",
-                "name": f"DIM_{dim}",
-                "type": "TABLE",
-                "owner": "DWH_USER",
-                "object_id": self._next_id(),
-                "created_at": self._random_date().isoformat(),
-                "modified_at": self._random_date().isoformat(),
-                "description": f"{dim} dimension table",
-                "columns": columns,
-                "row_count": random.randint(1000, 1000000),
-                "size_bytes": random.randint(10000000, 500000000)
-            }
+            columns = self._generate_columns(self.rng.randint(8, 20))
+
+            self.objects[table_id] = SampleObject(
+                id=table_id,
+                schema="DWH",
+                name=f"DIM_{dim}",
+                type="TABLE",
+                owner="DWH_USER",
+                object_id=self._next_id(),
+                created_at=self._random_date(),
+                modified_at=self._random_date(),
+                description=f"{dim} dimension table",
+                columns=columns,
+                row_count=self.rng.randint(1000, 1000000),
+                size_bytes=self.rng.randint(10000000, 500000000)
+            )
+            self.dwh_tables.append(table_id)
+            self.tables.append(table_id)
 
             # Dependencies from staging
             if staging_tables:
-                for src in random.sample(staging_tables, min(2, len(staging_tables))):
-                    self.table_deps.append({
-                        "source_id": src,
-                        "target_id": table_id,
-                        "dependency_type": "ETL",
-                        "reference_type": "INSERT_SELECT"
-                    })
+                for src in self.rng.sample(staging_tables, min(2, len(staging_tables))):
+                    self.table_deps.append(SampleDependency(
+                        source_id=src,
+                        target_id=table_id,
+                        dependency_type="ETL",
+                        reference_type="INSERT_SELECT"
+                    ))
 
     def _generate_mart_views(self):
         """Generate mart layer views."""
-        dwh_tables = [k for k in self.objects.keys() if k.startswith("DWH.")]
+        dwh_tables = self.dwh_tables
 
         for mart in ["SALES", "FINANCE", "MARKETING", "OPERATIONS"]:
             schema_name = f"MART_{mart}"
             for i in range(20):
-                view_name = f"VW_{mart}_{random.choice(DOMAIN_NAMES)}_{i + 1}"
+                view_name = f"VW_{mart}_{self.rng.choice(DOMAIN_NAMES)}_{i + 1}"
                 view_id = f"{schema_name}.{view_name}"
 
-                columns = self._generate_view_columns(random.randint(5, 15))
-                self.objects[view_id] = {
-                    "id": view_id,
-                    "schema": schema_name,
-                    "name": view_name,
-                    "type": "VIEW",
-                    "owner": "ANALYST_USER",
-                    "object_id": self._next_id(),
-                    "created_at": self._random_date().isoformat(),
-                    "modified_at": self._random_date().isoformat(),
-                    "description": f"Mart view for {mart} analytics",
-                    "definition": f"CREATE VIEW {view_id} AS SELECT ... FROM ...",
-                    "columns": columns
-                }
+                columns = self._generate_view_columns(self.rng.randint(5, 15))
+                self.objects[view_id] = SampleObject(
+                    id=view_id,
+                    schema=schema_name,
+                    name=view_name,
+                    type="VIEW",
+                    owner="ANALYST_USER",
+                    object_id=self._next_id(),
+                    created_at=self._random_date(),
+                    modified_at=self._random_date(),
+                    description=f"Mart view for {mart} analytics",
+                    definition=f"CREATE VIEW {view_id} AS SELECT ... FROM ...",
+                    columns=columns
+                )
+                self.mart_views.append(view_id)
 
                 # Dependencies from DWH
                 if dwh_tables:
-                    sources = random.sample(dwh_tables, min(4, len(dwh_tables)))
+                    sources = self.rng.sample(dwh_tables, min(4, len(dwh_tables)))
                     for src in sources:
-                        self.table_deps.append({
-                            "source_id": src,
-                            "target_id": view_id,
-                            "dependency_type": "VIEW",
-                            "reference_type": "SELECT"
-                        })
+                        self.table_deps.append(SampleDependency(
+                            source_id=src,
+                            target_id=view_id,
+                            dependency_type="VIEW",
+                            reference_type="SELECT"
+                        ))
                         self._add_column_deps(src, view_id)
 
     def _generate_report_views(self):
         """Generate report layer views."""
-        mart_views = [k for k in self.objects.keys() if k.startswith("MART_")]
+        mart_views = self.mart_views
 
         for i in range(40):
-            period = random.choice(["DAILY", "WEEKLY", "MONTHLY", "QUARTERLY", "YTD"])
-            domain = random.choice(DOMAIN_NAMES)
+            period = self.rng.choice(["DAILY", "WEEKLY", "MONTHLY", "QUARTERLY", "YTD"])
+            domain = self.rng.choice(DOMAIN_NAMES)
             view_name = f"RPT_{period}_{domain}_{i + 1}"
             view_id = f"REPORT.{view_name}"
 
-            columns = self._generate_view_columns(random.randint(3, 10))
-            self.objects[view_id] = {
-                "id": view_id,
-                "schema": "REPORT",
-                "name": view_name,
-                "type": "VIEW",
-                "owner": "REPORT_USER",
-                "object_id": self._next_id(),
-                "created_at": self._random_date().isoformat(),
-                "description": f"{period} report for {domain}",
-                "definition": f"CREATE VIEW {view_id} AS SELECT ... FROM ...",
-                "columns": columns
-            }
+            columns = self._generate_view_columns(self.rng.randint(3, 10))
+            self.objects[view_id] = SampleObject(
+                id=view_id,
+                schema="REPORT",
+                name=view_name,
+                type="VIEW",
+                owner="REPORT_USER",
+                object_id=self._next_id(),
+                created_at=self._random_date(),
+                description=f"{period} report for {domain}",
+                definition=f"CREATE VIEW {view_id} AS SELECT ... FROM ...",
+                columns=columns
+            )
 
             # Dependencies from marts
             if mart_views:
-                sources = random.sample(mart_views, min(3, len(mart_views)))
+                sources = self.rng.sample(mart_views, min(3, len(mart_views)))
                 for src in sources:
-                    self.table_deps.append({
-                        "source_id": src,
-                        "target_id": view_id,
-                        "dependency_type": "VIEW",
-                        "reference_type": "SELECT"
-                    })
+                    self.table_deps.append(SampleDependency(
+                        source_id=src,
+                        target_id=view_id,
+                        dependency_type="VIEW",
+                        reference_type="SELECT"
+                    ))
                     self._add_column_deps(src, view_id)
 
     def _generate_udfs(self):
         """Generate Lua UDFs."""
-        tables = [k for k in self.objects.keys() if self.objects[k]["type"] == "TABLE"]
+        tables = self.tables
 
         for schema_name in ["ETL", "UTILS", "ANALYTICS"]:
             for i in range(15):
-                udf_type = random.choice(["SCALAR", "SET"])
-                domain = random.choice(DOMAIN_NAMES)
-                udf_name = f"{random.choice(UDF_PREFIXES)}_{domain}_{i + 1}"
+                udf_type = self.rng.choice(["SCALAR", "SET"])
+                domain = self.rng.choice(DOMAIN_NAMES)
+                udf_name = f"{self.rng.choice(UDF_PREFIXES)}_{domain}_{i + 1}"
                 udf_id = f"{schema_name}.{udf_name}"
 
-                self.objects[udf_id] = {
-                    "id": udf_id,
-                    "schema": schema_name,
-                    "name": udf_name,
-                    "type": "LUA_UDF",
-                    "owner": "ETL_USER",
-                    "object_id": self._next_id(),
-                    "created_at": self._random_date().isoformat(),
-                    "description": f"Lua UDF for {domain} processing",
-                    "udf_type": udf_type,
-                    "input_parameters": [
+                self.objects[udf_id] = SampleObject(
+                    id=udf_id,
+                    schema=schema_name,
+                    name=udf_name,
+                    type="LUA_UDF",
+                    owner="ETL_USER",
+                    object_id=self._next_id(),
+                    created_at=self._random_date(),
+                    description=f"Lua UDF for {domain} processing",
+                    udf_type=udf_type,
+                    input_parameters=[
                         {"name": "input_data", "data_type": "VARCHAR(2000000)"}
                     ],
-                    "output_columns": [
+                    output_columns=[
                         {"name": "result", "data_type": "VARCHAR(2000000)"},
                         {"name": "status", "data_type": "VARCHAR(50)"}
                     ],
-                    "script_language": "LUA",
-                    "script_text": f"-- {udf_name} Lua script\nfunction run(ctx)\n  -- Processing logic\nend"
-                }
+                    script_language="LUA",
+                    script_text=f"-- {udf_name} Lua script\nfunction run(ctx)\n  -- Processing logic\nend"
+                )
 
                 # Some UDFs process data from tables
-                if random.random() < 0.3 and tables:
-                    src = random.choice(tables)
-                    self.table_deps.append({
-                        "source_id": src,
-                        "target_id": udf_id,
-                        "dependency_type": "UDF_INPUT",
-                        "reference_type": "PARAMETER"
-                    })
+                if self.rng.random() < 0.3 and tables:
+                    src = self.rng.choice(tables)
+                    self.table_deps.append(SampleDependency(
+                        source_id=src,
+                        target_id=udf_id,
+                        dependency_type="UDF_INPUT",
+                        reference_type="PARAMETER"
+                    ))
 
     def _create_deep_chains(self):
         """Create deep dependency chains (12+ levels)."""
@@ -388,17 +507,17 @@ class SampleDataGenerator:
 
             # Level 1: Connection
             conn_id = f"SYS.CONN_CHAIN_{chain_num}"
-            self.objects[conn_id] = {
-                "id": conn_id,
-                "schema": "SYS",
-                "name": f"CONN_CHAIN_{chain_num}",
-                "type": "CONNECTION",
-                "owner": "SYS",
-                "object_id": self._next_id(),
-                "created_at": self._random_date().isoformat(),
-                "connection_string": f"jdbc:chain://server{chain_num}:5432/db",
-                "description": f"Deep chain {chain_num} source connection"
-            }
+            self.objects[conn_id] = SampleObject(
+                id=conn_id,
+                schema="SYS",
+                name=f"CONN_CHAIN_{chain_num}",
+                type="CONNECTION",
+                owner="SYS",
+                object_id=self._next_id(),
+                created_at=self._random_date(),
+                connection_string=f"jdbc:chain://server{chain_num}:5432/db",
+                description=f"Deep chain {chain_num} source connection"
+            )
             chain_objects.append(conn_id)
 
             prev_id = conn_id
@@ -436,90 +555,102 @@ class SampleDataGenerator:
 
                 obj_id = f"{schema}.{name}"
 
-                obj_data = {
-                    "id": obj_id,
-                    "schema": schema,
-                    "name": name,
-                    "type": obj_type,
-                    "owner": "CHAIN_USER",
-                    "object_id": self._next_id(),
-                    "created_at": self._random_date().isoformat(),
-                    "description": f"Deep chain {chain_num} level {level}"
-                }
+                obj_data = SampleObject(
+                    id=obj_id,
+                    schema=schema,
+                    name=name,
+                    type=obj_type,
+                    owner="CHAIN_USER",
+                    object_id=self._next_id(),
+                    created_at=self._random_date(),
+                    description=f"Deep chain {chain_num} level {level}"
+                )
 
                 if columns:
-                    obj_data["columns"] = columns
+                    obj_data.columns = columns
 
                 if obj_type == "VIEW":
-                    obj_data["definition"] = f"CREATE VIEW {obj_id} AS SELECT ... FROM {prev_id}"
+                    obj_data.definition = f"CREATE VIEW {obj_id} AS SELECT ... FROM {prev_id}"
 
                 if obj_type == "VIRTUAL_SCHEMA":
-                    obj_data["adapter_name"] = "CHAIN_JDBC"
-                    obj_data["connection_name"] = prev_id.split(".")[1]
+                    obj_data.adapter_name = "CHAIN_JDBC"
+                    obj_data.connection_name = prev_id.split(".")[1]
 
                 self.objects[obj_id] = obj_data
 
                 # Add dependency from previous level
                 dep_type = "CONNECTION" if level == 2 else ("VIEW" if obj_type == "VIEW" else "ETL")
-                self.table_deps.append({
-                    "source_id": prev_id,
-                    "target_id": obj_id,
-                    "dependency_type": dep_type,
-                    "reference_type": "USES" if dep_type == "CONNECTION" else "SELECT"
-                })
-
-                if columns and prev_id in self.objects and self.objects[prev_id].get("columns"):
+                self.table_deps.append(SampleDependency(
+                    source_id=prev_id,
+                    target_id=obj_id,
+                    dependency_type=dep_type,
+                    reference_type="USES" if dep_type == "CONNECTION" else "SELECT"
+                ))
+
+                if columns and prev_id in self.objects and self.objects[prev_id].columns:
                     self._add_column_deps(prev_id, obj_id)
 
                 chain_objects.append(obj_id)
                 prev_id = obj_id
 
-    def _generate_columns(self, count: int, include_measures: bool = False) -> List[dict]:
-        """Generate realistic columns for a table."""
-        columns = []
+    def _generate_columns(self, count: int, include_measures: bool = False, view: bool = False) -> List[dict]:
+        """Generate realistic columns for a table (or, with view set, a view)."""
+        # Sized up front; filled in by position
+        columns: List[dict] = [None] * count
 
         # Always add ID column
-        columns.append({
-            "name": "ID",
-            "data_type": "DECIMAL(18,0)",
-            "ordinal_position": 1,
-            "is_nullable": False,
-            "is_primary_key": True,
-            "description": "Primary key"
-        })
-
-        col_types = list(COLUMN_TYPES.keys())
-        used_names: Set[str] = {"ID"}
-
-        for i in range(2, count + 1):
-            col_type = random.choice(col_types)
-            col_name_base = random.choice(COLUMN_TYPES[col_type])
-
-            # Ensure unique column names
-            col_name = col_name_base
-            suffix = 1
-            while col_name in used_names:
-                col_name = f"{col_name_base}_{suffix}"
-                suffix += 1
-            used_names.add(col_name)
-
-            columns.append({
-                "name": col_name,
-                "data_type": DATA_TYPES[col_type],
-                "ordinal_position": i,
-                "is_nullable": random.random() > 0.3,
-                "is_primary_key": False,
-                "description": f"{col_type.title()} field"
-            })
+        columns[0] = self._share_column(
+            view,
+            name="ID",
+            data_type="DECIMAL(18,0)",
+            ordinal_position=1,
+            is_nullable=False,
+            is_primary_key=True,
+            description="Primary key"
+        )
+
+        # Draw all remaining columns in one call
+        picks = self.rng.choices(FLAT_COLUMNS, cum_weights=FLAT_COLUMN_CUM_WEIGHTS, k=count - 1)
+        # Times each base name has been used; the primary key already took "ID".
+        # No base name ends in _<n>, so a suffixed name can never collide.
+        name_counts: Dict[str, int] = defaultdict(int, ID=1)
+
+        for i, (col_name_base, data_type, col_type) in enumerate(picks, start=2):
+            # Ensure unique column names: BASE, BASE_1, BASE_2, ...
+            suffix = name_counts[col_name_base]
+            name_counts[col_name_base] = suffix + 1
+            col_name = f"{col_name_base}_{suffix}" if suffix else col_name_base
+
+            columns[i - 1] = self._share_column(
+                view,
+                name=col_name,
+                data_type=data_type,
+                ordinal_position=i,
+                is_nullable=self.rng.random() > 0.3,
+                is_primary_key=False,
+                description=f"{col_type.title()} field"
+            )
 
         return columns
 
+    def _share_column(self, view: bool, **fields) -> dict:
+        """
+        The column dict with these fields, shared by every object with an identical column.
+
+        Generated columns are never modified afterwards, so one dict can back them all;
+        view columns additionally carry an (empty) source_columns list.
+        """
+        key = (view, *fields.values())
+        column = self._column_pool.get(key)
+        if column is None:
+            if view:
+                fields["source_columns"] = []
+            column = self._column_pool[key] = fields
+        return column
+
     def _generate_view_columns(self, count: int) -> List[dict]:
         """Generate columns for a view with source tracking."""
-        columns = self._generate_columns(count)
-        for col in columns:
-            col["source_columns"] = []
-        return columns
+        return self._generate_columns(count, view=True)
 
     def _add_column_deps(self, source_id: str, target_id: str):
         """Add column-level dependencies between two objects with realistic transformations."""
@@ -529,48 +660,19 @@ class SampleDataGenerator:
         if not source_obj or not target_obj:
             return
 
-        source_cols = source_obj.get("columns", [])
-        target_cols = target_obj.get("columns", [])
+        source_cols = source_obj.columns
+        target_cols = target_obj.columns
 
         if not source_cols or not target_cols:
             return
 
         # Create column mappings with different transformation types
-        num_mappings = min(len(source_cols), len(target_cols), random.randint(3, 8))
-
-        # Transformations by type
-        transformation_configs = [
-            # (transformation_type, sql_pattern, weight)
-            ("DIRECT", None, 40),  # Direct mapping - most common
-            ("AGGREGATE", "SUM({col})", 10),
-            ("AGGREGATE", "COUNT({col})", 8),
-            ("AGGREGATE", "AVG({col})", 5),
-            ("AGGREGATE", "MAX({col})", 4),
-            ("AGGREGATE", "MIN({col})", 3),
-            ("CAST", "CAST({col} AS VARCHAR)", 8),
-            ("CAST", "CAST({col} AS DATE)", 5),
-            ("CAST", "CAST({col} AS DECIMAL(15,2))", 3),
-            ("FUNCTION", "COALESCE({col}, 0)", 6),
-            ("FUNCTION", "NVL({col}, '')", 4),
-            ("FUNCTION", "UPPER({col})", 5),
-            ("FUNCTION", "TRIM({col})", 4),
-            ("FUNCTION", "CONCAT(prefix_, {col})", 2),
-            ("EXPRESSION", "{col} * 100", 5),
-            ("EXPRESSION", "{col} + 1", 3),
-            ("EXPRESSION", "{col} || ' ' || other_col", 2),
-            ("CASE", "CASE WHEN {col} > 0 THEN 'POSITIVE' ELSE 'NEGATIVE' END", 4),
-            ("CASE", "CASE WHEN {col} IS NULL THEN 'N/A' ELSE {col} END", 3),
-        ]
-
-        # Build weighted list for random selection
-        weighted_transforms = []
-        for trans_type, sql_pattern, weight in transformation_configs:
-            weighted_transforms.extend([(trans_type, sql_pattern)] * weight)
+        num_mappings = min(len(source_cols), len(target_cols), self.rng.randint(3, 8))
 
         used_pairs = set()
         for _ in range(num_mappings):
-            src_col = random.choice(source_cols)
-            tgt_col = random.choice(target_cols)
+            src_col = self.rng.choice(source_cols)
+            tgt_col = self.rng.choice(target_cols)
 
             # Avoid duplicate column pairs
             pair_key = (src_col["name"], tgt_col["name"])
@@ -578,7 +680,7 @@ class SampleDataGenerator:
                 continue
             used_pairs.add(pair_key)
 
-            trans_type, sql_pattern = random.choice(weighted_transforms)
+            trans_type, sql_pattern = self.rng.choice(WEIGHTED_TRANSFORMS)
 
             # Generate transformation SQL
             if sql_pattern:
@@ -586,51 +688,36 @@ class SampleDataGenerator:
             else:
                 transformation = None
 
-            self.column_deps.append({
-                "source_object_id": source_id,
-                "source_column": src_col["name"],
-                "target_object_id": target_id,
-                "target_column": tgt_col["name"],
-                "transformation": transformation,
-                "transformation_type": trans_type,
-            })
+            self.column_deps.append(SampleColumnDependency(
+                source_object_id=source_id,
+                source_column=src_col["name"],
+                target_object_id=target_id,
+                target_column=tgt_col["name"],
+                transformation=transformation,
+                transformation_type=trans_type,
+            ))
 
     def _next_id(self) -> int:
-        self.object_counter += 1
-        return self.object_counter
+        return next(self._object_ids)
 
-    def _random_date(self) -> datetime:
-        days_ago = random.randint(0, 365 * 2)
-        return datetime.now() - timedelta(days=days_ago)
+    def _random_date(self) -> str:
+        """ISO timestamp of a random day within the last two years."""
+        return self.rng.choice(self._date_pool)
 
     def _build_cache(self) -> dict:
         """Build final cache structure with indexes."""
-        by_schema: Dict[str, List[str]] = {}
-        by_type: Dict[str, List[str]] = {}
-        forward_edges: Dict[str, List[str]] = {}
-        backward_edges: Dict[str, List[str]] = {}
+        by_schema: Dict[str, List[str]] = defaultdict(list)
+        by_type: Dict[str, List[str]] = defaultdict(list)
+        forward_edges: Dict[str, List[str]] = defaultdict(list)
+        backward_edges: Dict[str, List[str]] = defaultdict(list)
 
         for obj_id, obj in self.objects.items():
-            schema = obj["schema"]
-            obj_type = obj["type"]
-
-            if schema not in by_schema:
-                by_schema[schema] = []
-            by_schema[schema].append(obj_id)
-
-            if obj_type not in by_type:
-                by_type[obj_type] = []
-            by_type[obj_type].append(obj_id)
+            by_schema[obj.schema].append(obj_id)
+            by_type[obj.type].append(obj_id)
 
         for dep in self.table_deps:
-            src, tgt = dep["source_id"], dep["target_id"]
-
-            if src not in forward_edges:
-                forward_edges[src] = []
+            src, tgt = dep.source_id, dep.target_id
             forward_edges[src].append(tgt)
-
-            if tgt not in backward_edges:
-                backward_edges[tgt] = []
             backward_edges[tgt].append(src)
 
         return {
@@ -639,19 +726,37 @@ class SampleDataGenerator:
                 "generated_at": datetime.now().isoformat(),
                 "source_database": "EXASOL_SAMPLE",
                 "object_count": len(self.objects),
-                "column_count": sum(len(obj.get("columns", [])) for obj in self.objects.values()),
+                "column_count": sum(len(obj.columns or ()) for obj in self.objects.values()),
                 "dependency_count": len(self.table_deps)
             },
-            "objects": self.objects,
+            "objects": {obj_id: obj.to_dict() for obj_id, obj in self.objects.items()},
             "dependencies": {
-                "table_level": self.table_deps,
-                "column_level": self.column_deps
+                "table_level": [
+                    {
+                        "source_id": dep.source_id,
+                        "target_id": dep.target_id,
+                        "dependency_type": dep.dependency_type,
+                        "reference_type": dep.reference_type,
+                    }
+                    for dep in self.table_deps
+                ],
+                "column_level": [
+                    {
+                        "source_object_id": dep.source_object_id,
+                        "source_column": dep.source_column,
+                        "target_object_id": dep.target_object_id,
+                        "target_column": dep.target_column,
+                        "transformation": dep.transformation,
+                        "transformation_type": dep.transformation_type,
+                    }
+                    for dep in self.column_deps
+                ]
             },
             "indexes": {
-                "by_schema": by_schema,
-                "by_type": by_type,
-                "forward_edges": forward_edges,
-                "backward_edges": backward_edges
+                "by_schema": dict(by_schema),
+                "by_type": dict(by_type),
+                "forward_edges": dict(forward_edges),
+                "backward_edges": dict(backward_edges)
             }
         }
 
@@ -663,8 +768,7 @@ def main():
     output_path = Path(__file__).parent.parent / "data" / "lineage_cache.json"
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
-    with open(output_path, "w") as f:
-        json.dump(cache, f, indent=2)
+    write_json_stream(cache, output_path)
 
     print(f"\nCache written to {output_path}")
     print(f"File size: {output_path.stat().st_size / 1024 / 1024:.2f} MB")
@@ -9,10 +9,11 @@ Usage:
     python merge_caches.py --base lineage_cache.json --new github_lineage.json --output merged.json
 """
 import argparse
-import json
 from datetime import datetime
 from pathlib import Path
 
+from common import read_json, write_json
+
 
 def normalize_objects(objects):
     """Convert objects to dict format if it's a list.
@@ -159,11 +160,8 @@ def main():
     parser.add_argument("--output", required=True, help="Output file")
     args = parser.parse_args()
 
-    with open(args.base) as f:
-        base_cache = json.load(f)
-
-    with open(args.new) as f:
-        new_cache = json.load(f)
+    base_cache = read_json(args.base)
+    new_cache = read_json(args.new)
 
     before_objects = len(normalize_objects(base_cache.get("objects", {})))
     before_deps = len(get_deps_list(base_cache.get("dependencies", []), "table_level"))
@@ -175,8 +173,7 @@ def main():
     after_deps = len(merged["dependencies"]["table_level"])
     after_col_deps = len(merged["dependencies"]["column_level"])
 
-    with open(args.output, "w") as f:
-        json.dump(merged, f, indent=2)
+    write_json(merged, Path(args.output))
 
     print(f"Merged: {args.new} -> {args.base}")
     print(f"Objects: {before_objects} -> {after_objects} (+{added_objects} new, {updated_objects} enriched)")